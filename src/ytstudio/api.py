@@ -1,25 +1,43 @@
+import atexit
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
 from urllib.parse import parse_qs, urlparse
 
+import httplib2
 import typer
 from google.auth.exceptions import RefreshError
-from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.discovery import Resource, build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
+from googleapiclient.model import JsonModel
 from oauthlib.oauth2 import AccessDeniedError, OAuth2Error
 from rich.prompt import Prompt
 
+try:
+    import orjson  # optional: faster decoding of API response bodies
+except ImportError:
+    orjson = None
+
+from ytstudio.cache import clear_http_cache, http_cache_dir
 from ytstudio.config import (
     CLIENT_SECRETS_FILE,
     clear_credentials,
     get_active_profile,
     load_credentials,
+    load_profile_meta,
     save_credentials,
     save_profile_meta,
 )
 from ytstudio.ui import console, success_message
 
+if TYPE_CHECKING:
+    from google.auth.transport.requests import Request
+    from google_auth_oauthlib.flow import InstalledAppFlow
+
 
 def handle_api_error(error: HttpError) -> None:
     if error.resp.status == 403:
@@ -59,6 +77,44 @@ def api(request):
         raise SystemExit(1) from None
 
 
+def with_own_connection(request):
+    """Give `request` a fresh connection so it can execute on another thread.
+
+    httplib2.Http is not thread-safe, so the cached client's connection must
+    stay with the thread that uses it. The credentials are shared.
+    """
+    request.http = _authorized_http(request.http.credentials)
+    return request
+
+
+def api_batch(service, requests: dict[str, object]) -> dict[str, dict]:
+    """Execute independent requests against one service in a single HTTP round trip.
+
+    Responses are keyed like ``requests``. A failed sub-request is handled the
+    same way :func:`api` handles a failed request.
+
+    Usage:
+        responses = api_batch(service, {"video": service.videos().list(...), ...})
+    """
+    responses: dict[str, dict] = {}
+    errors: list[HttpError] = []
+
+    def collect(request_id, response, exception):
+        if exception is not None:
+            errors.append(exception)
+        else:
+            responses[request_id] = response
+
+    batch = service.new_batch_http_request(callback=collect)
+    for request_id, request in requests.items():
+        batch.add(request, request_id=request_id)
+    api(batch)
+
+    for error in errors:
+        handle_api_error(error)
+    return responses
+
+
 # YouTube API scopes
 SCOPES = [
     "https://www.googleapis.com/auth/youtube.readonly",
@@ -72,8 +128,48 @@ SCOPES = [
 
 HEADLESS_REDIRECT_URI = "http://127.0.0.1:9876/"
 
+# Per-process caches. build() parses a large discovery document on every call,
+# and a single command can resolve the same service several times.
+_credentials_cache: dict[str, Credentials] = {}
+_service_cache: dict[tuple[str, str, int], Resource] = {}
+
+# A token this close to expiry is refreshed in the background while the current
+# command still uses it, so the next command does not wait on the refresh.
+PREFRESH_WINDOW = timedelta(minutes=10)
+# Seconds the process waits at exit for an unfinished background refresh.
+PREFRESH_EXIT_WAIT = 3.0
+
+# Channel statistics stored in the profile metadata are shown by `status`
+# without a round trip for this many seconds.
+CHANNEL_STATS_TTL = 3600
+CHANNEL_FIELDS = "items(id,snippet(title,customUrl),statistics(subscriberCount,videoCount))"
+
+
+class _OrjsonModel(JsonModel):
+    """JsonModel that decodes response bodies with orjson when it is installed."""
+
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return super().deserialize(content)
+        if self._data_wrapper and isinstance(body, dict) and "data" in body:
+            body = body["data"]
+        return body
+
+
+# None lets build() pick the stock stdlib JsonModel.
+RESPONSE_MODEL = _OrjsonModel() if orjson is not None else None
+
+
+# The OAuth flow and the requests-based refresh transport are only needed on
+# login and token refresh; importing them lazily keeps them (and requests/urllib3)
+# off the startup path of every other command.
+
+
+def _create_flow() -> "InstalledAppFlow":
+    from google_auth_oauthlib.flow import InstalledAppFlow  # noqa: PLC0415
 
-def _create_flow() -> InstalledAppFlow:
     return InstalledAppFlow.from_client_secrets_file(
         str(CLIENT_SECRETS_FILE),
         scopes=SCOPES,
@@ -89,27 +185,40 @@ def _save_credentials(credentials: Credentials, profile: str | None = None) -> N
         "client_secret": credentials.client_secret,
         "scopes": credentials.scopes,
     }
+    if credentials.expiry:
+        creds_data["expiry"] = credentials.expiry.isoformat()
     save_credentials(creds_data, profile)
 
 
+def _channel_meta(channel: dict) -> dict:
+    snippet = channel["snippet"]
+    stats = channel.get("statistics", {})
+    return {
+        "id": channel.get("id", ""),
+        "title": snippet.get("title", ""),
+        "custom_url": snippet.get("customUrl", ""),
+        "subscriber_count": stats.get("subscriberCount"),
+        "video_count": stats.get("videoCount"),
+        "stats_fetched_at": time.time(),
+    }
+
+
 def _fetch_channel_info(credentials: Credentials) -> dict | None:
     # Best-effort: a quota/network error here must not fail a successful login.
     try:
-        service = build("youtube", "v3", credentials=credentials)
-        response = service.channels().list(part="snippet", mine=True).execute()
+        service = _build_service(credentials, "youtube", "v3")
+        response = (
+            service.channels()
+            .list(part="snippet,statistics", mine=True, fields=CHANNEL_FIELDS)
+            .execute()
+        )
     except Exception:
         return None
 
     items = response.get("items")
     if not items:
         return None
-
-    snippet = items[0]["snippet"]
-    return {
-        "id": items[0].get("id", ""),
-        "title": snippet.get("title", ""),
-        "custom_url": snippet.get("customUrl", ""),
-    }
+    return _channel_meta(items[0])
 
 
 def _show_login_success(credentials: Credentials, profile: str) -> None:
@@ -120,6 +229,10 @@ def _show_login_success(credentials: Credentials, profile: str) -> None:
         save_profile_meta(profile, info)
         success_message(f"Logged in as: {info['title']}")
     else:
+        # Everything in the metadata (ids, title, cached statistics) describes the
+        # channel of a previous login of this profile; status refetches it.
+        if load_profile_meta(profile):
+            save_profile_meta(profile, {})
         success_message("Authentication successful")
 
 
@@ -199,36 +312,84 @@ def authenticate(headless: bool = False, profile: str | None = None) -> None:
     credentials = _authenticate_headless() if headless else _authenticate_local_server()
 
     _save_credentials(credentials, profile)
+    _credentials_cache.pop(profile, None)
     _show_login_success(credentials, profile)
 
 
-def get_credentials(profile: str | None = None) -> Credentials | None:
-    profile = profile or get_active_profile()
-    creds_data = load_credentials(profile)
-    if not creds_data:
-        return None
+def _refresh_request() -> "Request":
+    from google.auth.transport.requests import Request  # noqa: PLC0415
+
+    return Request()
+
 
-    credentials = Credentials(
+def _credentials_from_data(creds_data: dict) -> Credentials:
+    # google-auth compares expiry as a naive UTC datetime.
+    expiry = creds_data.get("expiry")
+    return Credentials(
         token=creds_data.get("token"),
         refresh_token=creds_data.get("refresh_token"),
         token_uri=creds_data.get("token_uri"),
         client_id=creds_data.get("client_id"),
         client_secret=creds_data.get("client_secret"),
         scopes=creds_data.get("scopes"),
+        expiry=datetime.fromisoformat(expiry) if expiry else None,
     )
 
+
+def _save_refreshed_token(creds_data: dict, credentials: Credentials, profile: str) -> None:
+    creds_data["token"] = credentials.token
+    if credentials.expiry:
+        creds_data["expiry"] = credentials.expiry.isoformat()
+    save_credentials(creds_data, profile)
+
+
+def _expires_soon(credentials: Credentials) -> bool:
+    if not credentials.expiry:
+        return False
+    return credentials.expiry - datetime.now(UTC).replace(tzinfo=None) < PREFRESH_WINDOW
+
+
+def _refresh_in_background(creds_data: dict, profile: str) -> None:
+    def refresh() -> None:
+        credentials = _credentials_from_data(creds_data)
+        try:
+            credentials.refresh(_refresh_request())
+        except Exception:
+            return  # Best-effort: the next command refreshes inline once expired.
+        _save_refreshed_token(dict(creds_data), credentials, profile)
+
+    thread = threading.Thread(target=refresh, daemon=True)
+    thread.start()
+    # Daemon threads die with the interpreter, and most commands finish well
+    # before a refresh does; wait briefly at exit so the new token gets saved.
+    atexit.register(thread.join, PREFRESH_EXIT_WAIT)
+
+
+def get_credentials(profile: str | None = None) -> Credentials | None:
+    profile = profile or get_active_profile()
+    cached = _credentials_cache.get(profile)
+    if cached is not None and not cached.expired:
+        return cached
+
+    creds_data = load_credentials(profile)
+    if not creds_data:
+        return None
+
+    credentials = _credentials_from_data(creds_data)
+
     if credentials.expired and credentials.refresh_token:
         try:
-            credentials.refresh(Request())
+            credentials.refresh(_refresh_request())
         except RefreshError:
             console.print(
                 "[red]Session expired or revoked.[/red] Run [bold]ytstudio login[/bold] to re-authenticate."
             )
             raise SystemExit(1) from None
-        # Save refreshed credentials
-        creds_data["token"] = credentials.token
-        save_credentials(creds_data, profile)
+        _save_refreshed_token(creds_data, credentials, profile)
+    elif credentials.refresh_token and _expires_soon(credentials):
+        _refresh_in_background(creds_data, profile)
 
+    _credentials_cache[profile] = credentials
     return credentials
 
 
@@ -237,42 +398,82 @@ def get_authenticated_service(
     version: str = "v3",
     profile: str | None = None,
 ):
+    profile = profile or get_active_profile()
     credentials = get_credentials(profile)
     if not credentials:
         console.print("[red]Not authenticated. Run 'ytstudio login' first.[/red]")
         raise typer.Exit(1)
-    return build(api_name, version, credentials=credentials)
+
+    # Data API responses are ETag-revalidated from disk; analytics reports have
+    # their own TTL cache in ytstudio.cache.
+    cache_dir = http_cache_dir(profile) if api_name == "youtube" else None
+    return _build_service(credentials, api_name, version, cache_dir)
+
+
+def _authorized_http(credentials: Credentials, cache_dir: str | None = None) -> AuthorizedHttp:
+    # build_http() sets the client's default timeout and stops httplib2 from
+    # following 308s, which resumable uploads use for "Resume Incomplete".
+    http = build_http()
+    if cache_dir is not None:
+        http.cache = httplib2.FileCache(cache_dir)
+    return AuthorizedHttp(credentials, http=http)
+
+
+def _build_service(
+    credentials: Credentials, api_name: str, version: str, cache_dir: str | None = None
+) -> Resource:
+    # Keyed on the credentials object: a refresh or re-login yields a new one.
+    key = (api_name, version, id(credentials))
+    service = _service_cache.get(key)
+    if service is None:
+        # One keep-alive connection per service, reused by every request it makes.
+        service = build(
+            api_name,
+            version,
+            http=_authorized_http(credentials, cache_dir),
+            cache_discovery=False,
+            static_discovery=True,
+            model=RESPONSE_MODEL,
+        )
+        _service_cache[key] = service
+    return service
 
 
 def get_status(profile: str | None = None) -> None:
-    creds_data = load_credentials(profile)
-
-    if not creds_data:
+    # get_credentials already loads (and if needed refreshes) the stored token.
+    credentials = get_credentials(profile)
+    if credentials is None:
         console.print("[yellow]Not authenticated. Run 'ytstudio login' to authenticate.[/yellow]")
         return
 
-    credentials = get_credentials(profile)
-    if not credentials or not credentials.valid:
+    if not credentials.valid:
         console.print(
             "[yellow]Credentials expired. Run 'ytstudio login' to re-authenticate.[/yellow]"
         )
         return
 
-    # Get channel info
-    service = build("youtube", "v3", credentials=credentials)
-    response = api(service.channels().list(part="snippet,statistics", mine=True))
-
-    if response.get("items"):
-        channel = response["items"][0]
-        snippet = channel["snippet"]
-        stats = channel["statistics"]
+    # Login stores the channel and its statistics; refresh them once they age.
+    profile = profile or get_active_profile()
+    meta = load_profile_meta(profile)
+    if time.time() - meta.get("stats_fetched_at", 0) > CHANNEL_STATS_TTL:
+        service = get_authenticated_service("youtube", "v3", profile=profile)
+        response = api(
+            service.channels().list(part="snippet,statistics", mine=True, fields=CHANNEL_FIELDS)
+        )
+        if not response.get("items"):
+            return
+        meta = {**meta, **_channel_meta(response["items"][0])}
+        save_profile_meta(profile, meta)
 
-        success_message("Authenticated")
-        console.print(f"  Channel: [bold]{snippet['title']}[/bold]")
-        console.print(f"  Subscribers: {stats.get('subscriberCount', 'N/A')}")
-        console.print(f"  Videos: {stats.get('videoCount', 'N/A')}")
+    success_message("Authenticated")
+    console.print(f"  Channel: [bold]{meta['title']}[/bold]")
+    console.print(f"  Subscribers: {meta.get('subscriber_count') or 'N/A'}")
+    console.print(f"  Videos: {meta.get('video_count') or 'N/A'}")
 
 
 def logout() -> None:
     clear_credentials()
+    clear_http_cache(get_active_profile())
+    _credentials_cache.clear()
+    _service_cache.clear()
     success_message("Logged out successfully")
@@ -0,0 +1,114 @@
+"""On-disk caches: YouTube Analytics report responses and Data API HTTP responses.
+
+Analytics data only refreshes every few hours, so re-running a command (or
+flipping its --output format) can reuse the previous response instead of
+spending another round trip and quota on an identical reports.query call.
+
+Data API resources carry ETags; keeping httplib2's HTTP cache on disk lets
+repeat lookups revalidate with If-None-Match and get an empty 304 back.
+httplib2 never evicts entries, so ones left unused for HTTP_CACHE_MAX_AGE
+are pruned here, at most once per HTTP_PRUNE_INTERVAL.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+
+from ytstudio.ui import console
+
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "ytstudio-cli"
+ANALYTICS_TTL = 3600
+TTL_ENV_VAR = "YTSTUDIO_CACHE_TTL"
+HTTP_CACHE_MAX_AGE = 7 * 86400
+HTTP_PRUNE_INTERVAL = 86400
+
+
+def _entry_path(namespace: str, params: dict) -> Path:
+    key = json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+    return CACHE_DIR / namespace / f"{hashlib.sha1(key.encode()).hexdigest()}.json"
+
+
+def analytics_ttl() -> int:
+    """Seconds a cached report stays fresh: YTSTUDIO_CACHE_TTL if set, else ANALYTICS_TTL."""
+    env = os.environ.get(TTL_ENV_VAR)
+    if env:
+        if env.isdigit():
+            return int(env)
+        console.print(
+            f"[yellow]Ignoring invalid {TTL_ENV_VAR}='{env}'; "
+            f"using {ANALYTICS_TTL} seconds.[/yellow]"
+        )
+    return ANALYTICS_TTL
+
+
+def load(namespace: str, params: dict, ttl: int | None = None) -> dict | None:
+    """Cached response for `params`, or None when missing, expired or unreadable."""
+    if ttl is None:
+        ttl = analytics_ttl()
+    path = _entry_path(namespace, params)
+    try:
+        if time.time() - path.stat().st_mtime >= ttl:
+            return None
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def store(namespace: str, params: dict, response: dict) -> None:
+    """Best-effort write; a read-only or full cache dir never fails the command."""
+    path = _entry_path(namespace, params)
+    tmp = path.with_name(path.name + ".tmp")
+    try:
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            os.write(fd, json.dumps(response).encode())
+        finally:
+            os.close(fd)
+        tmp.replace(path)
+    except OSError:
+        return
+
+
+def http_cache_dir(profile: str) -> str | None:
+    """Private per-profile directory for httplib2's cache, or None if it cannot be created."""
+    # Per profile: `mine=true` URLs are identical across accounts.
+    path = CACHE_DIR / "http" / profile
+    try:
+        path.mkdir(mode=0o700, parents=True, exist_ok=True)
+    except OSError:
+        return None
+    _prune_http_cache(path)
+    return str(path)
+
+
+def _prune_http_cache(path: Path) -> None:
+    """Drop entries untouched for HTTP_CACHE_MAX_AGE; a 304 rewrites the entry it hits."""
+    marker = path / ".pruned"
+    now = time.time()
+    try:
+        if now - marker.stat().st_mtime < HTTP_PRUNE_INTERVAL:
+            return
+    except OSError:
+        pass
+    try:
+        entries = list(path.iterdir())
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            if entry != marker and now - entry.stat().st_mtime >= HTTP_CACHE_MAX_AGE:
+                entry.unlink()
+        except OSError:
+            continue
+    try:
+        marker.touch()
+    except OSError:
+        return
+
+
+def clear_http_cache(profile: str) -> None:
+    shutil.rmtree(CACHE_DIR / "http" / profile, ignore_errors=True)
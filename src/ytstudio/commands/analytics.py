@@ -1,12 +1,15 @@
 import csv
-import io
-import json
-from dataclasses import asdict, dataclass
-from datetime import date, datetime, timedelta
+import sys
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date, timedelta
+from functools import lru_cache
 
 import typer
 
-from ytstudio.api import api
+from ytstudio import cache
+from ytstudio.api import api, api_batch, with_own_connection
 from ytstudio.registry import (
     DIMENSION_GROUPS,
     DIMENSIONS,
@@ -18,8 +21,24 @@ from ytstudio.registry import (
     validate_dimensions,
     validate_metrics,
 )
-from ytstudio.services import get_analytics_service, get_data_service
-from ytstudio.ui import console, create_kv_table, create_table, dim, format_number, set_raw_output
+from ytstudio.services import (
+    get_analytics_service,
+    get_channel_id,
+    get_data_service,
+    load_channel_id,
+    store_channel_id,
+)
+from ytstudio.ui import (
+    PLAIN_TABLE_ROWS,
+    console,
+    create_kv_table,
+    create_table,
+    dim,
+    format_number,
+    print_json,
+    print_plain_table,
+    set_raw_output,
+)
 
 app = typer.Typer(help="Analytics commands")
 
@@ -34,19 +53,52 @@ class VideoAnalytics:
     comments: int
 
 
-def get_channel_id(service) -> str:
-    response = api(service.channels().list(part="id", mine=True))
-    if not response.get("items"):
-        console.print("[red]No channel found[/red]")
-        raise typer.Exit(1)
-    return response["items"][0]["id"]
+@lru_cache(maxsize=32)
+def _date_range(days: int, today: date, offset: int = 0) -> tuple[str, str]:
+    """ISO (start, end) for a `days`-long window ending `offset` days before `today`."""
+    end = today - timedelta(days=offset)
+    return (end - timedelta(days=days)).isoformat(), end.isoformat()
+
+
+def _rows_as(fields: tuple[str, ...], response: dict) -> list[tuple]:
+    """Rows reduced to `fields`, in that order; fields missing from the response read as 0."""
+    headers = [h["name"] for h in response.get("columnHeaders", [])]
+    idx = [headers.index(f) if f in headers else None for f in fields]
+    return [tuple(0 if i is None else row[i] for i in idx) for row in response.get("rows", [])]
+
+
+def _run_report(
+    analytics_service,
+    query_params: dict,
+    use_cache: bool = True,
+    cache_ttl: int | None = None,
+    own_connection: bool = False,
+    *,
+    store: bool = True,
+) -> dict:
+    """reports.query, served from the on-disk cache when an identical query is fresh.
+
+    Pass `own_connection` when calling from a worker thread, and `store=False`
+    for a response that must not be served to later runs.
+    """
+    if use_cache:
+        cached = cache.load("analytics", query_params, cache_ttl)
+        if cached is not None:
+            return cached
+    request = analytics_service.reports().query(**query_params)
+    if own_connection:
+        request = with_own_connection(request)
+    response = api(request)
+    if store:
+        cache.store("analytics", query_params, response)
+    return response
 
 
 def fetch_query(
     data_service,
     analytics_service,
     *,
-    metric_names: list[str],
+    metric_names: Sequence[str],
     dimension_names: list[str],
     start_date: str,
     end_date: str,
@@ -55,8 +107,13 @@ def fetch_query(
     sort: str | None = None,
     max_results: int | None = None,
     currency: str | None = None,
+    use_cache: bool = True,
+    cache_ttl: int | None = None,
+    channel_id: str | None = None,
+    own_connection: bool = False,
+    store: bool = True,
 ) -> dict:
-    channel_id = get_channel_id(data_service)
+    channel_id = channel_id or get_channel_id(data_service)
 
     query_params = {
         "ids": f"channel=={channel_id}",
@@ -76,8 +133,21 @@ def fetch_query(
     if currency:
         query_params["currency"] = currency
 
-    return api(analytics_service.reports().query(**query_params))
+    return _run_report(
+        analytics_service, query_params, use_cache, cache_ttl, own_connection, store=store
+    )
+
 
+# Order matches the positional unpacking in overview.
+OVERVIEW_METRICS = (
+    MetricName.VIEWS,
+    MetricName.ESTIMATED_MINUTES_WATCHED,
+    MetricName.AVERAGE_VIEW_DURATION,
+    MetricName.SUBSCRIBERS_GAINED,
+    MetricName.SUBSCRIBERS_LOST,
+    MetricName.LIKES,
+    MetricName.COMMENTS,
+)
 
 # Metrics shown with a period-over-period delta in the overview.
 OVERVIEW_COMPARE_METRICS = (
@@ -118,32 +188,41 @@ def overview(
         help="Compare each metric to the previous equal-length window",
     ),
     output: str = typer.Option("table", "--output", "-o", help="Output format: table, json"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Bypass the analytics response cache"),
 ):
     """Get channel overview analytics"""
-    metric_names = [
-        MetricName.VIEWS,
-        MetricName.ESTIMATED_MINUTES_WATCHED,
-        MetricName.AVERAGE_VIEW_DURATION,
-        MetricName.SUBSCRIBERS_GAINED,
-        MetricName.SUBSCRIBERS_LOST,
-        MetricName.LIKES,
-        MetricName.COMMENTS,
-    ]
-
-    end_date = datetime.now().strftime("%Y-%m-%d")
-    start_date = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+    today = date.today()
+    start_date, end_date = _date_range(days, today)
 
     data_service = get_data_service()
     analytics_service = get_analytics_service()
-    response = fetch_query(
-        data_service,
-        analytics_service,
-        metric_names=metric_names,
-        dimension_names=[],
-        start_date=start_date,
-        end_date=end_date,
-        days=days,
-    )
+    # Resolved up front so the worker thread never touches data_service.
+    channel_id = get_channel_id(data_service)
+
+    def fetch_window(start: str, end: str, own_connection: bool = False) -> dict:
+        return fetch_query(
+            data_service,
+            analytics_service,
+            metric_names=OVERVIEW_METRICS,
+            dimension_names=[],
+            start_date=start,
+            end_date=end,
+            days=days,
+            use_cache=not no_cache,
+            channel_id=channel_id,
+            own_connection=own_connection,
+        )
+
+    # Previous equal-length window ending the day before the current one starts,
+    # so the two windows do not share a boundary day. It is fetched on a worker
+    # thread while the current window is fetched here.
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pending_previous = None
+        if compare:
+            prev_start, prev_end = _date_range(days, today, offset=days + 1)
+            pending_previous = pool.submit(fetch_window, prev_start, prev_end, own_connection=True)
+        response = fetch_window(start_date, end_date)
+        prev_response = pending_previous.result() if pending_previous else None
 
     headers = [h["name"] for h in response.get("columnHeaders", [])]
     rows = response.get("rows", [])
@@ -154,52 +233,32 @@ def overview(
 
     metrics = dict(zip(headers, rows[0], strict=False))
 
-    # Previous equal-length window ending the day before the current one starts,
-    # so the two windows do not share a boundary day.
     previous = None
     pct_change = None
-    if compare:
-        prev_end = (datetime.now() - timedelta(days=days + 1)).strftime("%Y-%m-%d")
-        prev_start = (datetime.now() - timedelta(days=days * 2 + 1)).strftime("%Y-%m-%d")
-        prev_response = fetch_query(
-            data_service,
-            analytics_service,
-            metric_names=metric_names,
-            dimension_names=[],
-            start_date=prev_start,
-            end_date=prev_end,
-            days=days,
-        )
-        prev_rows = prev_response.get("rows", [])
-        if prev_rows:
-            prev_headers = [h["name"] for h in prev_response.get("columnHeaders", [])]
-            previous = dict(zip(prev_headers, prev_rows[0], strict=False))
-            pct_change = {
-                m: _pct_change(float(metrics.get(m, 0)), float(previous.get(m, 0)))
-                for m in OVERVIEW_COMPARE_METRICS
-            }
+    prev_rows = prev_response.get("rows", []) if prev_response else []
+    if prev_rows:
+        prev_headers = [h["name"] for h in prev_response.get("columnHeaders", [])]
+        previous = dict(zip(prev_headers, prev_rows[0], strict=False))
+        pct_change = {
+            m: _pct_change(float(metrics.get(m, 0)), float(previous.get(m, 0)))
+            for m in OVERVIEW_COMPARE_METRICS
+        }
 
     if output == "json":
-        print(
-            json.dumps(
-                {
-                    "analytics": metrics,
-                    "days": days,
-                    "previous": previous,
-                    "pct_change": pct_change,
-                },
-                indent=2,
-            )
+        print_json(
+            {
+                "analytics": metrics,
+                "days": days,
+                "previous": previous,
+                "pct_change": pct_change,
+            }
         )
         return
 
-    views = int(metrics.get("views", 0))
-    watch_hours = int(metrics.get("estimatedMinutesWatched", 0)) // 60
-    avg_secs = int(metrics.get("averageViewDuration", 0))
-    subs_gained = int(metrics.get("subscribersGained", 0))
-    subs_lost = int(metrics.get("subscribersLost", 0))
-    likes = int(metrics.get("likes", 0))
-    comments = int(metrics.get("comments", 0))
+    views, watch_minutes, avg_secs, subs_gained, subs_lost, likes, comments = (
+        int(value) for value in _rows_as(OVERVIEW_METRICS, response)[0]
+    )
+    watch_hours = watch_minutes // 60
 
     subtitle = f"(last {days} days"
     subtitle += f" vs previous {days})" if previous is not None else ")"
@@ -222,75 +281,127 @@ def overview(
     console.print(table)
 
 
-def fetch_video_analytics(
-    data_service, analytics_service, video_id: str, days: int
-) -> VideoAnalytics | None:
-    channel_id = get_channel_id(data_service)
-    end_date = datetime.now().strftime("%Y-%m-%d")
-    start_date = (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
-
-    response = api(
-        analytics_service.reports().query(
-            ids=f"channel=={channel_id}",
-            startDate=start_date,
-            endDate=end_date,
-            metrics=",".join(
-                (
-                    MetricName.VIEWS,
-                    MetricName.ESTIMATED_MINUTES_WATCHED,
-                    MetricName.AVERAGE_VIEW_DURATION,
-                    MetricName.AVERAGE_VIEW_PERCENTAGE,
-                    MetricName.LIKES,
-                    MetricName.COMMENTS,
-                )
-            ),
-            filters=f"video=={video_id}",
-        )
-    )
+# Order matches the positional unpacking in _video_analytics.
+VIDEO_METRICS = (
+    MetricName.VIEWS,
+    MetricName.ESTIMATED_MINUTES_WATCHED,
+    MetricName.AVERAGE_VIEW_DURATION,
+    MetricName.AVERAGE_VIEW_PERCENTAGE,
+    MetricName.LIKES,
+    MetricName.COMMENTS,
+)
+_VIDEO_METRICS_PARAM = ",".join(VIDEO_METRICS)
+
+
+def _video_report_params(channel_id: str, video_id: str, days: int) -> dict:
+    start_date, end_date = _date_range(days, date.today())
+    return {
+        "ids": f"channel=={channel_id}",
+        "startDate": start_date,
+        "endDate": end_date,
+        "metrics": _VIDEO_METRICS_PARAM,
+        "filters": f"video=={video_id}",
+    }
 
-    if not response.get("rows"):
-        return None
 
-    row = response["rows"][0]
-    metrics = {h["name"]: row[i] for i, h in enumerate(response["columnHeaders"])}
+def _video_analytics(response: dict) -> VideoAnalytics | None:
+    rows = _rows_as(VIDEO_METRICS, response)
+    if not rows:
+        return None
 
+    views, watch_minutes, avg_secs, avg_pct, likes, comments = rows[0]
     return VideoAnalytics(
-        views=int(metrics.get("views", 0)),
-        watch_time_minutes=int(metrics.get("estimatedMinutesWatched", 0)),
-        avg_view_duration_secs=int(metrics.get("averageViewDuration", 0)),
-        avg_view_percentage=float(metrics.get("averageViewPercentage", 0)),
-        likes=int(metrics.get("likes", 0)),
-        comments=int(metrics.get("comments", 0)),
+        views=int(views),
+        watch_time_minutes=int(watch_minutes),
+        avg_view_duration_secs=int(avg_secs),
+        avg_view_percentage=float(avg_pct),
+        likes=int(likes),
+        comments=int(comments),
     )
 
 
+def fetch_video_analytics(
+    data_service,
+    analytics_service,
+    video_id: str,
+    days: int,
+    *,
+    channel_id: str | None = None,
+    use_cache: bool = True,
+) -> VideoAnalytics | None:
+    channel_id = channel_id or get_channel_id(data_service)
+    params = _video_report_params(channel_id, video_id, days)
+    return _video_analytics(_run_report(analytics_service, params, use_cache))
+
+
 @app.command()
 def video(
     video_id: str = typer.Argument(..., help="Video ID"),
     days: int = typer.Option(28, "--days", "-d", help="Number of days to analyze"),
     output: str = typer.Option("table", "--output", "-o", help="Output format: table, json"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Bypass the analytics response cache"),
 ):
     """Get analytics for a specific video"""
     data_service = get_data_service()
-    analytics_service = get_analytics_service()
+    use_cache = not no_cache
+    video_list = data_service.videos().list(part="snippet,statistics", id=video_id)
+
+    channel_id = load_channel_id()
+    if channel_id is not None:
+        params = _video_report_params(channel_id, video_id, days)
+        response = cache.load("analytics", params) if use_cache else None
+        if response is not None:
+            video_items = api(video_list).get("items")
+        else:
+            # The analytics query needs nothing from the video lookup, so both go
+            # out at once. Each service has its own httplib2.Http; no connection is
+            # shared. The report is only cached once the video is known to exist.
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                pending = pool.submit(api, get_analytics_service().reports().query(**params))
+                video_items = api(video_list).get("items")
+                response = pending.result()
+            if video_items:
+                cache.store("analytics", params, response)
+        if not video_items:
+            console.print(f"[red]Video not found: {video_id}[/red]")
+            raise typer.Exit(1)
+        analytics = _video_analytics(response)
+    else:
+        # An uncached channel id lookup is independent of the video lookup: one round trip.
+        responses = api_batch(
+            data_service,
+            {
+                "video": video_list,
+                "channel": data_service.channels().list(part="id", mine=True, fields="items(id)"),
+            },
+        )
+
+        video_items = responses.get("video", {}).get("items")
+        if not video_items:
+            console.print(f"[red]Video not found: {video_id}[/red]")
+            raise typer.Exit(1)
 
-    video_response = api(data_service.videos().list(part="snippet,statistics", id=video_id))
+        channel_items = responses.get("channel", {}).get("items")
+        if not channel_items:
+            console.print("[red]No channel found[/red]")
+            raise typer.Exit(1)
+        channel_id = channel_items[0]["id"]
+        store_channel_id(channel_id)
 
-    if not video_response.get("items"):
-        console.print(f"[red]Video not found: {video_id}[/red]")
-        raise typer.Exit(1)
+        analytics = fetch_video_analytics(
+            data_service,
+            get_analytics_service(),
+            video_id,
+            days,
+            channel_id=channel_id,
+            use_cache=use_cache,
+        )
 
-    video_data = video_response["items"][0]
+    video_data = video_items[0]
     snippet = video_data["snippet"]
-    analytics = fetch_video_analytics(data_service, analytics_service, video_id, days)
 
     if output == "json":
-        print(
-            json.dumps(
-                {"video": video_data, "analytics": asdict(analytics) if analytics else None},
-                indent=2,
-            )
-        )
+        print_json({"video": video_data, "analytics": analytics})
         return
 
     console.print(f"\n[bold]{snippet['title']}[/bold]")
@@ -356,12 +467,18 @@ def _fetch_snippet_titles(data_service, resource: str, ids: list[str]) -> dict[s
     if not ids:
         return {}
 
+    # Only the titles are read; let the API drop the rest of each snippet.
+    fields = "items(id,snippet/title)"
     titles: dict[str, str] = {}
     for batch in _chunks(ids, 50):
         if resource == "video":
-            response = api(data_service.videos().list(part="snippet", id=",".join(batch)))
+            response = api(
+                data_service.videos().list(part="snippet", id=",".join(batch), fields=fields)
+            )
         elif resource == "playlist":
-            response = api(data_service.playlists().list(part="snippet", id=",".join(batch)))
+            response = api(
+                data_service.playlists().list(part="snippet", id=",".join(batch), fields=fields)
+            )
         else:
             raise ValueError(f"Unsupported resource for title resolution: {resource}")
 
@@ -414,15 +531,18 @@ def _format_query_response(response: dict, output: str) -> None:
 
     if output == "json":
         records = [dict(zip(headers, row, strict=False)) for row in rows]
-        print(json.dumps(records, indent=2))
+        print_json(records)
+        return
+
+    if output == "json-columns":
+        # Header names once plus positional rows: no per-row dict, about half the bytes.
+        print_json({"columnHeaders": headers, "rows": rows})
         return
 
     if output == "csv":
-        buf = io.StringIO()
-        writer = csv.writer(buf)
+        writer = csv.writer(sys.stdout, lineterminator="\n")
         writer.writerow(headers)
         writer.writerows(rows)
-        print(buf.getvalue(), end="")
         return
 
     # table output
@@ -430,6 +550,13 @@ def _format_query_response(response: dict, output: str) -> None:
         console.print("[yellow]No data returned[/yellow]")
         return
 
+    formatters = [_cell_formatter(header) for header in headers]
+    cells = [tuple(fmt(v) for fmt, v in zip(formatters, row, strict=False)) for row in rows]
+    if len(cells) > PLAIN_TABLE_ROWS:
+        numeric = tuple(i for i, header in enumerate(headers) if header in METRICS)
+        print_plain_table(headers, cells, right_aligned=numeric)
+        return
+
     table = create_table()
     for header in headers:
         is_numeric = header in METRICS
@@ -439,24 +566,34 @@ def _format_query_response(response: dict, output: str) -> None:
             style="yellow" if header in DIMENSIONS else None,
         )
 
-    for row in rows:
-        table.add_row(*[_format_cell(headers[i], v) for i, v in enumerate(row)])
+    for row in cells:
+        table.add_row(*row)
 
     console.print(table)
 
 
-def _format_cell(header: str, value) -> str:
-    if isinstance(value, int):
-        return format_number(value)
-    if isinstance(value, float):
-        if "rate" in header.lower() or "percentage" in header.lower() or "ctr" in header.lower():
-            return f"{value:.2f}%"
-        if "cpm" in header.lower():
-            return f"${value:.2f}"
-        if value == int(value):
-            return format_number(int(value))
-        return f"{value:.1f}"
-    return str(value)
+def _cell_formatter(header: str) -> Callable[[object], str]:
+    """Formatter for one column's cells; the header is inspected once, not per cell."""
+    name = header.lower()
+    if "rate" in name or "percentage" in name or "ctr" in name:
+        float_format = "{:.2f}%".format
+    elif "cpm" in name:
+        float_format = "${:.2f}".format
+    else:
+        float_format = None
+
+    def format_cell(value) -> str:
+        if isinstance(value, int):
+            return format_number(value)
+        if isinstance(value, float):
+            if float_format is not None:
+                return float_format(value)
+            if value == int(value):
+                return format_number(int(value))
+            return f"{value:.1f}"
+        return str(value)
+
+    return format_cell
 
 
 @app.command()
@@ -481,19 +618,29 @@ def query(
     sort: str = typer.Option(None, "--sort", help="Sort field (prefix with - for descending)"),
     limit: int = typer.Option(None, "--limit", "-n", help="Maximum number of rows"),
     currency: str = typer.Option(None, "--currency", help="Currency code for revenue (e.g. EUR)"),
-    output: str = typer.Option("table", "--output", "-o", help="Output format: table, json, csv"),
+    output: str = typer.Option(
+        "table", "--output", "-o", help="Output format: table, json, json-columns, csv"
+    ),
     raw: bool = typer.Option(False, "--raw", help="Show raw numbers instead of human-readable"),
     resolve: bool = typer.Option(
         False,
         "--resolve",
         help="Resolve video/playlist dimension IDs to title columns",
     ),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Bypass the analytics response cache"),
+    cache_ttl: int = typer.Option(
+        None, "--cache-ttl", min=0, help="Seconds a cached response stays fresh (default 3600)"
+    ),
 ):
     """Run a custom analytics query with any metrics and dimensions.
 
     Direct access to the YouTube Analytics API reports.query endpoint.
     Supports all available metrics and dimensions.
 
+    -o json prints one object per row; -o json-columns prints
+    {"columnHeaders": [names], "rows": [[values]]}, which is more compact
+    for large results.
+
     Examples:
 
         ytstudio analytics query -m views,likes --dimensions day --days 7
@@ -539,16 +686,26 @@ def query(
     filters_str = None
     if filter_list:
         for f in filter_list:
-            if "==" not in f:
+            key, sep, value = f.partition("==")
+            if not (key and sep and value):
                 console.print(f"[red]Invalid filter format: '{f}'. Use key==value[/red]")
                 raise typer.Exit(1)
         filters_str = ";".join(filter_list)
 
     # Build dates, then snap to dimension-required boundaries (month, week).
-    end_date = end or datetime.now().strftime("%Y-%m-%d")
-    start_date = start or (datetime.now() - timedelta(days=days)).strftime("%Y-%m-%d")
+    today = date.today()
+    default_start, default_end = _date_range(days, today)
+    start_date = start or default_start
+    end_date = end or default_end
     start_date, end_date = _align_date_range(dimension_names, start_date, end_date)
 
+    # A day/month breakdown reaching today has a row that is still filling in;
+    # caching it would keep showing the partial figure, here or in any other
+    # command that issues the same query.
+    by_period = DimensionName.DAY in dimension_names or DimensionName.MONTH in dimension_names
+    partial = by_period and end_date >= today.isoformat()
+    use_cache = not no_cache and not partial
+
     # The video dimension requires sort + maxResults per YouTube API docs
     if DimensionName.VIDEO in dimension_names and (not sort or not limit):
         missing = [x for x, v in [("--sort", sort), ("--limit", limit)] if not v]
@@ -571,6 +728,9 @@ def query(
         sort=sort,
         max_results=limit,
         currency=currency,
+        use_cache=use_cache,
+        cache_ttl=cache_ttl,
+        store=not partial,
     )
 
     if resolve:
@@ -605,21 +765,8 @@ def list_metrics(
         filtered = [m for m in filtered if m.group == group]
 
     if output == "json":
-        print(
-            json.dumps(
-                [
-                    {
-                        "name": m.name,
-                        "description": m.description,
-                        "group": m.group,
-                        "core": m.core,
-                        "monetary": m.monetary,
-                    }
-                    for m in filtered
-                ],
-                indent=2,
-            )
-        )
+        # Metric and Dimension are dataclasses; print_json encodes their fields directly.
+        print_json(list(filtered))
         return
 
     title = "Available Metrics"
@@ -675,17 +822,7 @@ def list_dimensions(
 
         d = DIMENSIONS[name]
         if output == "json":
-            print(
-                json.dumps(
-                    {
-                        "name": d.name,
-                        "description": d.description,
-                        "group": d.group,
-                        "filter_only": d.filter_only,
-                    },
-                    indent=2,
-                )
-            )
+            print_json(d)
             return
 
         console.print(f"\n[bold]{d.name}[/bold]")
@@ -707,20 +844,7 @@ def list_dimensions(
         filtered = [d for d in filtered if d.group == group]
 
     if output == "json":
-        print(
-            json.dumps(
-                [
-                    {
-                        "name": d.name,
-                        "description": d.description,
-                        "group": d.group,
-                        "filter_only": d.filter_only,
-                    }
-                    for d in filtered
-                ],
-                indent=2,
-            )
-        )
+        print_json(list(filtered))
         return
 
     title = "Available Dimensions"
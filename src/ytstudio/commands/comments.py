@@ -1,13 +1,13 @@
-import json
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
+from datetime import UTC, datetime
 from enum import StrEnum
 
 import typer
 from googleapiclient.errors import HttpError
 
 from ytstudio.api import api, handle_api_error
-from ytstudio.services import get_data_service
-from ytstudio.ui import console, create_table, time_ago, truncate
+from ytstudio.services import get_channel_id, get_data_service
+from ytstudio.ui import console, create_table, print_json, time_ago, truncate
 
 app = typer.Typer(help="Comment commands")
 
@@ -37,14 +37,6 @@ class Comment:
     video_id: str = ""
 
 
-def get_channel_id(service) -> str:
-    response = api(service.channels().list(part="id", mine=True))
-    if not response.get("items"):
-        console.print("[red]No channel found[/red]")
-        raise typer.Exit(1)
-    return response["items"][0]["id"]
-
-
 def fetch_comments(
     data_service,
     video_id: str | None = None,
@@ -52,11 +44,11 @@ def fetch_comments(
     order: SortOrder = SortOrder.relevance,
     moderation_status: ModerationStatus = ModerationStatus.published,
 ) -> list[Comment]:
+    items = []
     try:
         # Build query parameters based on filters
         params = {
             "part": "snippet",
-            "maxResults": min(limit, 100),
             "order": order.value,
         }
 
@@ -68,7 +60,21 @@ def fetch_comments(
             if moderation_status != ModerationStatus.published:
                 params["moderationStatus"] = moderation_status.to_api_value()
 
-        response = api(data_service.commentThreads().list(**params))
+        # Pages are capped at 100 threads and each token comes from the previous
+        # page, so larger limits walk the pages in order.
+        page_token = None
+        while len(items) < limit:
+            response = api(
+                data_service.commentThreads().list(
+                    **params,
+                    maxResults=min(limit - len(items), 100),
+                    pageToken=page_token,
+                )
+            )
+            items.extend(response.get("items", []))
+            page_token = response.get("nextPageToken")
+            if not page_token:
+                break
     except HttpError as e:
         handle_api_error(e)
     except Exception as e:
@@ -76,7 +82,7 @@ def fetch_comments(
         raise typer.Exit(1) from None
 
     comments = []
-    for item in response.get("items", []):
+    for item in items[:limit]:
         snippet = item["snippet"]["topLevelComment"]["snippet"]
         comments.append(
             Comment(
@@ -110,7 +116,7 @@ def list_comments(
     comments = fetch_comments(service, video_id, limit, sort, status)
 
     if output == "json":
-        print(json.dumps([asdict(c) for c in comments], indent=2))
+        print_json(comments)
         return
 
     status_label = {"published": "Published", "held": "Held for Review", "spam": "Likely Spam"}
@@ -126,8 +132,9 @@ def list_comments(
     table.add_column("Posted")
     table.add_column("Comment")
 
+    now = datetime.now(UTC)
     for c in comments:
-        date = f"{c.published_at[:16].replace('T', ' ')} ({time_ago(c.published_at)})"
+        date = f"{c.published_at[:16].replace('T', ' ')} ({time_ago(c.published_at, now)})"
         row = [c.id]
         if not video_id:
             row.append(c.video_id)
@@ -1,4 +1,3 @@
-import json
 from dataclasses import asdict, dataclass
 from enum import StrEnum
 from typing import Any
@@ -13,6 +12,7 @@ from ytstudio.ui import (
     create_kv_table,
     create_table,
     dim,
+    print_json,
     success_message,
     truncate,
 )
@@ -252,15 +252,12 @@ def list_broadcasts(
         return
 
     if output is OutputFormat.json:
-        print(
-            json.dumps(
-                {
-                    "broadcasts": [asdict(b) for b in broadcasts],
-                    "next_page_token": response.get("nextPageToken"),
-                    "total_results": (response.get("pageInfo") or {}).get("totalResults", 0),
-                },
-                indent=2,
-            )
+        print_json(
+            {
+                "broadcasts": broadcasts,
+                "next_page_token": response.get("nextPageToken"),
+                "total_results": (response.get("pageInfo") or {}).get("totalResults", 0),
+            }
         )
         return
 
@@ -319,13 +316,13 @@ def show(
         stream = _fetch_stream_ingest(service, broadcast.bound_stream_id)
 
     if output is OutputFormat.json:
-        payload: dict[str, Any] = {"broadcast": asdict(broadcast)}
+        payload: dict[str, Any] = {"broadcast": broadcast}
         if stream:
             ingest_dump = asdict(stream)
             if not show_key:
                 ingest_dump["stream_name"] = _redact_key(ingest_dump["stream_name"])
             payload["ingest"] = ingest_dump
-        print(json.dumps(payload, indent=2))
+        print_json(payload)
         return
 
     console.print(f"\n[bold]{broadcast.title}[/bold]\n")
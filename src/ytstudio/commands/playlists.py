@@ -1,7 +1,6 @@
 import csv
-import json
 import sys
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
 
 import typer
 from google.auth.exceptions import RefreshError
@@ -9,13 +8,14 @@ from googleapiclient.errors import HttpError
 from rich.prompt import Confirm
 
 from ytstudio.api import api, handle_api_error
-from ytstudio.services import get_data_service
+from ytstudio.services import find_uploads_playlist_id, get_data_service
 from ytstudio.ui import (
     console,
     create_kv_table,
     create_table,
     dim,
     format_number,
+    print_json,
     success_message,
     truncate,
 )
@@ -53,13 +53,7 @@ _uploads_id_cache: dict[int, str | None] = {}
 def _resolve_uploads_id(service) -> str | None:
     sid = id(service)
     if sid not in _uploads_id_cache:
-        response = api(service.channels().list(part="contentDetails", mine=True)) or {}
-        items = response.get("items") or []
-        uploads = ""
-        if items:
-            related = (items[0].get("contentDetails") or {}).get("relatedPlaylists") or {}
-            uploads = related.get("uploads") or ""
-        _uploads_id_cache[sid] = uploads or None
+        _uploads_id_cache[sid] = find_uploads_playlist_id(service)
     return _uploads_id_cache[sid]
 
 
@@ -252,15 +246,12 @@ def list_playlists(
         all_playlists.sort(key=lambda p: p.item_count, reverse=True)
 
     if output == "json":
-        print(
-            json.dumps(
-                {
-                    "playlists": [asdict(p) for p in all_playlists],
-                    "next_page_token": next_page_token,
-                    "total_results": total_results,
-                },
-                indent=2,
-            )
+        print_json(
+            {
+                "playlists": all_playlists,
+                "next_page_token": next_page_token,
+                "total_results": total_results,
+            }
         )
         return
 
@@ -298,10 +289,10 @@ def show(
         rendered_items = _fetch_all_items(service, playlist_id, limit=50)
 
     if output == "json":
-        payload: dict = {"playlist": asdict(playlist)}
+        payload: dict = {"playlist": playlist}
         if items:
-            payload["items"] = [asdict(it) for it in rendered_items]
-        print(json.dumps(payload, indent=2))
+            payload["items"] = rendered_items
+        print_json(payload)
         return
 
     console.print(f"\n[bold]{playlist.title}[/bold]\n")
@@ -499,15 +490,12 @@ def items(
         current_token = next_page_token
 
     if output == "json":
-        print(
-            json.dumps(
-                {
-                    "items": [asdict(it) for it in all_items],
-                    "next_page_token": next_page_token,
-                    "total_results": total_results,
-                },
-                indent=2,
-            )
+        print_json(
+            {
+                "items": all_items,
+                "next_page_token": next_page_token,
+                "total_results": total_results,
+            }
         )
         return
 
@@ -1,5 +1,6 @@
 from datetime import UTC, datetime
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
 from googleapiclient.errors import HttpError
@@ -7,16 +8,12 @@ from rich.progress import BarColumn, Progress, TextColumn, TimeRemainingColumn
 
 from ytstudio.services import get_data_service
 from ytstudio.ui import console, create_table, dim
-from ytstudio.upload_pipeline import (
-    DiscoveryError,
-    UploadJob,
-    ValidationError,
-    discover,
-    set_thumbnail,
-    upload_video,
-    validate_jobs,
-    write_back,
-)
+
+if TYPE_CHECKING:
+    from ytstudio.upload_pipeline import UploadJob
+
+# upload_pipeline pulls in pydantic and ruamel.yaml (~100 ms); import it only
+# when an upload actually runs so every other command starts faster.
 
 
 class _QuotaExceeded(Exception):
@@ -28,7 +25,13 @@ def _is_quota_exceeded(e: HttpError) -> bool:
     return any(detail.get("reason") == "quotaExceeded" for detail in e.error_details or [])
 
 
-def _upload_one(service, job: UploadJob) -> str:
+def _upload_one(service, job: "UploadJob") -> str:
+    from ytstudio.upload_pipeline import (  # noqa: PLC0415
+        set_thumbnail,
+        upload_video,
+        write_back,
+    )
+
     file_size = job.video_path.stat().st_size
     with Progress(
         TextColumn("[bold blue]{task.fields[name]}"),
@@ -83,6 +86,13 @@ def upload(
     ),
 ) -> None:
     """Upload one or more videos described by yaml sidecars."""
+    from ytstudio.upload_pipeline import (  # noqa: PLC0415
+        DiscoveryError,
+        ValidationError,
+        discover,
+        validate_jobs,
+    )
+
     try:
         jobs = discover(path)
     except DiscoveryError as e:
@@ -1,20 +1,25 @@
-import json
+import csv
 import re
+import sys
 from dataclasses import asdict, dataclass, field
 from datetime import UTC, datetime
+from operator import attrgetter
 
 import typer
 from googleapiclient.errors import HttpError
 
 from ytstudio.api import api, handle_api_error
 from ytstudio.commands.upload import upload as _upload_cmd
-from ytstudio.services import get_data_service
+from ytstudio.services import get_data_service, get_uploads_playlist_id
 from ytstudio.ui import (
+    PLAIN_TABLE_ROWS,
     console,
     create_kv_table,
     create_table,
     dim,
     format_number,
+    print_json,
+    print_plain_table,
     success_message,
     truncate,
 )
@@ -52,12 +57,15 @@ class CaptionTrack:
     last_updated: str
 
 
+_ISO_DURATION_RE = re.compile(r"PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?")
+
+
 def format_duration(iso_duration: str) -> str:
     """Format ISO 8601 duration (PT1M19S -> 1:19)"""
     if not iso_duration:
         return ""
 
-    match = re.match(r"PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?", iso_duration)
+    match = _ISO_DURATION_RE.match(iso_duration)
     if not match:
         return ""
 
@@ -71,11 +79,7 @@ def format_duration(iso_duration: str) -> str:
 
 
 def get_channel_uploads_playlist(service) -> str:
-    response = api(service.channels().list(part="contentDetails", mine=True))
-    if not response.get("items"):
-        console.print("[red]No channel found[/red]")
-        raise typer.Exit(1)
-    return response["items"][0]["contentDetails"]["relatedPlaylists"]["uploads"]
+    return get_uploads_playlist_id(service)
 
 
 def fetch_video(data_service, video_id: str) -> Video | None:
@@ -83,6 +87,11 @@ def fetch_video(data_service, video_id: str) -> Video | None:
         data_service.videos().list(
             part="snippet,statistics,contentDetails,status,localizations",
             id=video_id,
+            fields=(
+                "items(id,snippet(title,description,publishedAt,tags,defaultLanguage,"
+                "defaultAudioLanguage),statistics(viewCount,likeCount,commentCount),"
+                "contentDetails/duration,status(privacyStatus,publishAt),localizations)"
+            ),
         )
     )
 
@@ -123,16 +132,27 @@ def fetch_videos(
     next_page_token = None
 
     parts = "statistics,status,snippet,contentDetails,localizations"
+    # Server-side projections: only the fields Video is built from come back.
+    playlist_fields = (
+        "items(snippet(title,description,publishedAt,resourceId/videoId)),"
+        "nextPageToken,pageInfo/totalResults"
+    )
+    video_fields = (
+        "items(id,statistics(viewCount,likeCount,commentCount),status(privacyStatus,publishAt),"
+        "snippet(tags,categoryId,defaultLanguage,defaultAudioLanguage),"
+        "contentDetails(duration,licensedContent),localizations)"
+    )
 
     while len(all_videos) < limit:
         batch_size = min(limit - len(all_videos), 50)
 
         playlist_response = api(
             data_service.playlistItems().list(
-                part="snippet,contentDetails",
+                part="snippet",
                 playlistId=uploads_playlist_id,
                 maxResults=batch_size,
                 pageToken=current_page_token,
+                fields=playlist_fields,
             )
         )
 
@@ -143,19 +163,20 @@ def fetch_videos(
         if not items:
             break
 
-        video_ids = [item["contentDetails"]["videoId"] for item in items]
+        video_ids = [item["snippet"]["resourceId"]["videoId"] for item in items]
 
         videos_response = api(
             data_service.videos().list(
                 part=parts,
                 id=",".join(video_ids),
+                fields=video_fields,
             )
         )
 
         stats_map = {v["id"]: v for v in videos_response.get("items", [])}
 
         for item in items:
-            video_id = item["contentDetails"]["videoId"]
+            video_id = item["snippet"]["resourceId"]["videoId"]
             data = stats_map.get(video_id, {})
             stats = data.get("statistics", {})
             snippet = data.get("snippet", {})
@@ -236,53 +257,53 @@ def list_videos(
     if has_localization:
         videos = [v for v in videos if has_localization in v.localizations]
 
-    if sort == "views":
-        videos.sort(key=lambda x: x.views, reverse=True)
-    elif sort == "likes":
-        videos.sort(key=lambda x: x.likes, reverse=True)
+    # "date" keeps the uploads playlist order, which is already newest first.
+    if sort in ("views", "likes"):
+        videos.sort(key=attrgetter(sort), reverse=True)
 
     if output == "json":
-        print(
-            json.dumps(
-                {
-                    "videos": [asdict(v) for v in videos],
-                    "next_page_token": result["next_page_token"],
-                    "total_results": result["total_results"],
-                },
-                indent=2,
-            )
+        print_json(
+            {
+                "videos": videos,
+                "next_page_token": result["next_page_token"],
+                "total_results": result["total_results"],
+            }
         )
     elif output == "csv":
-        print("id,title,views,likes,comments,privacy,published_at")
-        for v in videos:
-            title_escaped = v.title.replace('"', '""')
-            print(
-                f'{v.id},"{title_escaped}",{v.views},{v.likes},{v.comments},{v.privacy},{v.published_at}'
-            )
+        writer = csv.writer(sys.stdout, lineterminator="\n")
+        writer.writerow(["id", "title", "views", "likes", "comments", "privacy", "published_at"])
+        writer.writerows(
+            [v.id, v.title, v.views, v.likes, v.comments, v.privacy, v.published_at] for v in videos
+        )
     else:
-        table = create_table()
-        table.add_column("ID", style="yellow")
-        table.add_column("Title", style="cyan")
-        table.add_column("URL")
-        table.add_column("Views", justify="right")
-        table.add_column("Likes", justify="right")
-        table.add_column("Comments", justify="right")
-        table.add_column("Published")
-
-        for v in videos:
-            video_url = f"https://youtu.be/{v.id}"
-            title = truncate(v.title)
-            table.add_row(
+        rows = [
+            (
                 v.id,
-                title,
-                video_url,
+                truncate(v.title),
+                f"https://youtu.be/{v.id}",
                 format_number(v.views),
                 format_number(v.likes),
                 format_number(v.comments),
                 v.published_at[:10],
             )
-
-        console.print(table)
+            for v in videos
+        ]
+        headers = ["ID", "Title", "URL", "Views", "Likes", "Comments", "Published"]
+
+        if len(rows) > PLAIN_TABLE_ROWS:
+            print_plain_table(headers, rows, right_aligned=(3, 4, 5))
+        else:
+            table = create_table()
+            table.add_column("ID", style="yellow")
+            table.add_column("Title", style="cyan")
+            table.add_column("URL")
+            table.add_column("Views", justify="right")
+            table.add_column("Likes", justify="right")
+            table.add_column("Comments", justify="right")
+            table.add_column("Published")
+            for row in rows:
+                table.add_row(*row)
+            console.print(table)
 
         if result["next_page_token"]:
             console.print(f"\nNext page: --page-token {result['next_page_token']}")
@@ -302,7 +323,7 @@ def show(
         raise typer.Exit(1)
 
     if output == "json":
-        print(json.dumps(asdict(video), indent=2))
+        print_json(video)
         return
 
     console.print(f"\n[bold]{video.title}[/bold]")
@@ -359,6 +380,7 @@ def _select_track(tracks: list[CaptionTrack], lang: str | None) -> CaptionTrack
     return standard[0] if standard else candidates[0]
 
 
+_SRT_BLOCK_SEP_RE = re.compile(r"\n\s*\n")
 _SRT_INDEX_RE = re.compile(r"^\d+$")
 _SRT_TIMING_RE = re.compile(r"-->")
 _SRT_TAG_RE = re.compile(r"<[^>]+>")  # inline <c>/<00:00:00.000> styling in ASR tracks
@@ -374,7 +396,7 @@ def srt_to_text(srt: str, dedup_consecutive: bool = False) -> str:
     """
     normalized = srt.replace("\r\n", "\n").replace("\r", "\n")
     cues: list[str] = []
-    for block in re.split(r"\n\s*\n", normalized.strip()):
+    for block in _SRT_BLOCK_SEP_RE.split(normalized.strip()):
         texts = []
         for i, raw in enumerate(block.splitlines()):
             line = raw.strip()
@@ -419,7 +441,7 @@ def captions(
     tracks = fetch_caption_tracks(service, video_id)
 
     if output == "json":
-        print(json.dumps([asdict(t) for t in tracks], indent=2))
+        print_json(tracks)
         return
 
     if not tracks:
@@ -461,7 +483,7 @@ def transcript(
     if output == "json":
         payload = asdict(track)
         payload["transcript"] = text
-        print(json.dumps(payload, indent=2))
+        print_json(payload)
         return
     print(text)
 
@@ -529,6 +551,13 @@ def search_replace(
     execute: bool = typer.Option(False, "--execute", help="Apply changes (default is dry-run)"),
 ):
     """Bulk update videos using search and replace"""
+    # Compiled once up front: a bad pattern fails before any API call.
+    try:
+        pattern = re.compile(search) if regex else None
+    except re.error as e:
+        console.print(f"[red]Invalid regex: {e}[/red]")
+        raise typer.Exit(1) from None
+
     service = get_data_service()
 
     changes = []
@@ -560,8 +589,8 @@ def search_replace(
 
         for video in videos_response.get("items", []):
             old_value = video["snippet"].get(field, "")
-            if regex:
-                new_value = re.sub(search, replace, old_value)
+            if pattern is not None:
+                new_value = pattern.sub(replace, old_value)
             else:
                 new_value = old_value.replace(search, replace)
 
@@ -606,33 +635,66 @@ def search_replace(
     success = 0
     failed = 0
 
-    for c in changes:
+    # Re-read the current snippets right before writing (one call per 50 ids),
+    # so each update starts from the latest metadata rather than the scan's copy.
+    ids = [c["id"] for c in changes]
+    snippets = {}
+    for i in range(0, len(ids), 50):
+        response = api(service.videos().list(part="snippet", id=",".join(ids[i : i + 50])))
+        snippets.update((item["id"], item["snippet"]) for item in response.get("items", []))
+
+    # Updates go out as batch requests: one HTTP round trip per 50 PUTs. Results
+    # are reported in order once each batch returns.
+    pending = [c for c in changes if c["id"] in snippets]
+    errors: dict[str, Exception | None] = {}
+    no_response = object()  # sub-request the batch never called back for
+    quota_error: HttpError | None = None
+
+    def collect(request_id, _response, exception):
+        errors[request_id] = exception
+
+    for i in range(0, len(pending), 50):
+        chunk = pending[i : i + 50]
+        errors.clear()
+        batch = service.new_batch_http_request(callback=collect)
+        for n, c in enumerate(chunk):
+            snippet = {**snippets[c["id"]], field: c["new"]}
+            batch.add(
+                service.videos().update(part="snippet", body={"id": c["id"], "snippet": snippet}),
+                request_id=str(n),
+            )
         try:
-            response = api(service.videos().list(part="snippet", id=c["id"]))
-            if not response.get("items"):
-                continue
-
-            snippet = response["items"][0]["snippet"]
-            snippet[field] = c["new"]
-
-            api(service.videos().update(part="snippet", body={"id": c["id"], "snippet": snippet}))
+            api(batch)
+        except BaseException:
+            # Earlier batches are already applied; this one may be, in part.
+            console.print(
+                f"\n[bold]Partial progress:[/bold] {success} updated, {failed} failed, "
+                f"{len(chunk)} unconfirmed"
+            )
+            raise
 
-            console.print(f"[green]✓[/green] {c['id']}: {c['new']}")
-            success += 1
-        except HttpError as e:
-            # Quota exceeded - stop immediately
-            error_details = e.error_details[0] if e.error_details else {}
-            if error_details.get("reason") == "quotaExceeded":
-                console.print(
-                    f"\n[bold]Partial progress:[/bold] {success} updated, {failed} failed"
-                )
-                handle_api_error(e)
-            console.print(f"[red]✗[/red] {c['id']}: {e}")
-            failed += 1
-        except Exception as e:
+        for n, c in enumerate(chunk):
+            e = errors.get(str(n), no_response)
+            if e is None:
+                console.print(f"[green]✓[/green] {c['id']}: {c['new']}")
+                success += 1
+                continue
+            if e is no_response:
+                console.print(f"[red]✗[/red] {c['id']}: no response in batch")
+                failed += 1
+                continue
+            error_details = (e.error_details or [{}])[0] if isinstance(e, HttpError) else {}
+            if error_details.get("reason") == "quotaExceeded" and quota_error is None:
+                quota_error = e
             console.print(f"[red]✗[/red] {c['id']}: {e}")
             failed += 1
 
+        # Quota exceeded - stop before sending any further batch. The rest of this
+        # batch was already sent, so it is tallied above before exiting.
+        if quota_error is not None:
+            console.print(f"\n[bold]Partial progress:[/bold] {success} updated, {failed} failed")
+            handle_api_error(quota_error)
+
     console.print(f"\n[bold]Done:[/bold] {success} updated, {failed} failed")
 
 
@@ -653,7 +715,7 @@ def categories(
     items.sort(key=lambda c: int(c["id"]))
 
     if output == "json":
-        print(json.dumps(items, indent=2))
+        print_json(items)
         return
 
     table = create_table()
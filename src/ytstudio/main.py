@@ -3,11 +3,11 @@ import atexit
 import typer
 from googleapiclient.errors import HttpError
 from oauthlib.oauth2 import OAuth2Error
-from rich.console import Console
 
 from ytstudio.api import authenticate, get_status
 from ytstudio.commands import analytics, comments, livestreams, playlists, profile, videos
 from ytstudio.config import migrate_legacy_credentials, setup_credentials
+from ytstudio.ui import console
 from ytstudio.version import get_current_version, is_update_available
 
 app = typer.Typer(
@@ -17,8 +17,6 @@ app = typer.Typer(
     rich_markup_mode="markdown",
 )
 
-console = Console()
-
 app.add_typer(videos.app, name="videos")
 app.add_typer(analytics.app, name="analytics")
 app.add_typer(comments.app, name="comments")
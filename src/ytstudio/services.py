@@ -1,4 +1,8 @@
-from ytstudio.api import get_authenticated_service
+import typer
+
+from ytstudio.api import api, get_authenticated_service
+from ytstudio.config import get_active_profile, load_profile_meta, save_profile_meta
+from ytstudio.ui import console
 
 
 def get_data_service(profile: str | None = None):
@@ -7,3 +11,77 @@ def get_data_service(profile: str | None = None):
 
 def get_analytics_service(profile: str | None = None):
     return get_authenticated_service("youtubeAnalytics", "v2", profile=profile)
+
+
+# The channel id and its uploads playlist id never change for a profile, so they
+# are kept in the profile metadata instead of being fetched per command. Login
+# rewrites the metadata, which drops both if the profile switches account.
+
+
+def load_channel_id(profile: str | None = None) -> str | None:
+    return load_profile_meta(profile or get_active_profile()).get("id") or None
+
+
+def store_channel_id(channel_id: str, profile: str | None = None) -> None:
+    profile = profile or get_active_profile()
+    meta = load_profile_meta(profile)
+    if meta.get("id") != channel_id:
+        save_profile_meta(profile, {**meta, "id": channel_id})
+
+
+def get_channel_id(data_service, profile: str | None = None) -> str:
+    channel_id = load_channel_id(profile)
+    if channel_id:
+        return channel_id
+
+    response = api(data_service.channels().list(part="id", mine=True, fields="items(id)"))
+    if not response.get("items"):
+        console.print("[red]No channel found[/red]")
+        raise typer.Exit(1)
+
+    channel_id = response["items"][0]["id"]
+    store_channel_id(channel_id, profile)
+    return channel_id
+
+
+def load_uploads_playlist_id(profile: str | None = None) -> str | None:
+    return load_profile_meta(profile or get_active_profile()).get("uploads_playlist_id") or None
+
+
+def store_uploads_playlist_id(playlist_id: str, profile: str | None = None) -> None:
+    profile = profile or get_active_profile()
+    meta = load_profile_meta(profile)
+    if meta.get("uploads_playlist_id") != playlist_id:
+        save_profile_meta(profile, {**meta, "uploads_playlist_id": playlist_id})
+
+
+def find_uploads_playlist_id(data_service, profile: str | None = None) -> str | None:
+    """Uploads playlist id of the channel, or None when the account has no channel."""
+    playlist_id = load_uploads_playlist_id(profile)
+    if playlist_id:
+        return playlist_id
+
+    response = api(
+        data_service.channels().list(
+            part="contentDetails",
+            mine=True,
+            fields="items(contentDetails/relatedPlaylists/uploads)",
+        )
+    )
+    items = response.get("items") or []
+    if not items:
+        return None
+
+    related = (items[0].get("contentDetails") or {}).get("relatedPlaylists") or {}
+    playlist_id = related.get("uploads")
+    if playlist_id:
+        store_uploads_playlist_id(playlist_id, profile)
+    return playlist_id or None
+
+
+def get_uploads_playlist_id(data_service, profile: str | None = None) -> str:
+    playlist_id = find_uploads_playlist_id(data_service, profile)
+    if not playlist_id:
+        console.print("[red]No channel found[/red]")
+        raise typer.Exit(1)
+    return playlist_id
@@ -1,8 +1,19 @@
+import json
+import sys
+from collections.abc import Iterable
+from dataclasses import fields, is_dataclass
 from datetime import UTC, datetime
+from itertools import chain
 
+from rich.cells import cell_len
 from rich.console import Console
 from rich.table import Table
 
+try:
+    import orjson  # optional: much faster encoding of large JSON payloads
+except ImportError:
+    orjson = None
+
 console = Console()
 
 
@@ -27,6 +38,32 @@ def create_kv_table() -> Table:
     )
 
 
+# Above this many rows Rich's per-cell measuring dominates the command's run
+# time; long listings are written as plain aligned text instead.
+PLAIN_TABLE_ROWS = 100
+
+
+def _pad(text: str, width: int, right: bool) -> str:
+    # Padded by terminal cells, not code points: CJK and emoji take two cells.
+    gap = " " * (width - cell_len(text))
+    return gap + text if right else text + gap
+
+
+def print_plain_table(
+    headers: list[str], rows: list[tuple[str, ...]], right_aligned: tuple[int, ...] = ()
+) -> None:
+    """Write `rows` as space-separated, column-aligned text in a single write."""
+    widths = [max(map(cell_len, column)) for column in zip(headers, *rows, strict=True)]
+    lines = (
+        " ".join(
+            _pad(cell, width, i in right_aligned)
+            for i, (cell, width) in enumerate(zip(row, widths, strict=True))
+        ).rstrip()
+        for row in [headers, *rows]
+    )
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
 _state = {"raw": False}
 
 
@@ -34,20 +71,65 @@ def set_raw_output(value: bool):
     _state["raw"] = value
 
 
+_UNITS = ((1_000_000_000, "B"), (1_000_000, "M"), (1_000, "K"))
+
+
 def format_number(n: int) -> str:
-    if _state["raw"]:
-        return str(n)
-    if n >= 1_000_000:
-        return f"{n / 1_000_000:.1f}M"
-    if n >= 1_000:
-        return f"{n / 1_000:.1f}K"
+    if not _state["raw"]:
+        for threshold, suffix in _UNITS:
+            if n >= threshold:
+                return f"{n / threshold:.1f}{suffix}"
     return str(n)
 
 
-def time_ago(iso_timestamp: str) -> str:
-    """Format ISO timestamp as relative time (2h ago, 3d ago)"""
-    dt = datetime.fromisoformat(iso_timestamp.replace("Z", "+00:00"))
-    delta = datetime.now(UTC) - dt
+def _json_default(obj):
+    # Shallow on purpose: nested dataclasses come back through here, so unlike
+    # dataclasses.asdict nothing is deep-copied before encoding.
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def print_json(data) -> None:
+    """Write `data` to stdout as indented JSON, without an intermediate str where possible.
+
+    Dataclass instances are encoded as objects of their fields, like dataclasses.asdict.
+    """
+    if orjson is not None:
+        try:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            pass  # e.g. non-str keys or huge ints: let the stdlib handle it
+        else:
+            _write_utf8([payload])
+            return
+    # ensure_ascii=False matches orjson, so both paths print the same bytes.
+    encoder = json.JSONEncoder(indent=2, ensure_ascii=False, default=_json_default)
+    _write_utf8(chunk.encode() for chunk in chain(encoder.iterencode(data), "\n"))
+
+
+def _write_utf8(chunks: Iterable[bytes]) -> None:
+    # UTF-8 bytes go straight to the binary buffer, so a non-UTF-8 console
+    # encoding (e.g. cp1252) cannot fail on emoji or CJK titles.
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:  # replaced or wrapped stream without a binary layer
+        for chunk in chunks:
+            sys.stdout.write(chunk.decode())
+        return
+    sys.stdout.flush()
+    for chunk in chunks:
+        buffer.write(chunk)
+    buffer.flush()
+
+
+def time_ago(iso_timestamp: str, now: datetime | None = None) -> str:
+    """Format ISO timestamp as relative time (2h ago, 3d ago)
+
+    Pass `now` when formatting many timestamps so they share one reference time.
+    """
+    # fromisoformat accepts the trailing "Z" natively since Python 3.11.
+    dt = datetime.fromisoformat(iso_timestamp)
+    delta = (now or datetime.now(UTC)) - dt
 
     if delta.days > 365:
         return f"{delta.days // 365}y ago"
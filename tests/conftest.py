@@ -1,7 +1,11 @@
 from unittest.mock import MagicMock, patch
 
 import pytest
+from googleapiclient.errors import HttpError
 
+from ytstudio import api as _api_module
+from ytstudio import cache as _cache_module
+from ytstudio import config as _config_module
 from ytstudio.commands import playlists as _playlists_module
 
 MOCK_CHANNEL = {
@@ -60,9 +64,7 @@ MOCK_PLAYLIST_ITEM = {
     "snippet": {
         "title": MOCK_VIDEO["snippet"]["title"],
         "publishedAt": MOCK_VIDEO["snippet"]["publishedAt"],
-    },
-    "contentDetails": {
-        "videoId": MOCK_VIDEO["id"],
+        "resourceId": {"kind": "youtube#video", "videoId": MOCK_VIDEO["id"]},
     },
 }
 
@@ -151,8 +153,28 @@ MOCK_PLAYLIST_ITEM_FULL = {
 }
 
 
+class FakeBatch:
+    """Stand-in for BatchHttpRequest that runs the queued requests in order."""
+
+    def __init__(self, callback=None):
+        self._callback = callback
+        self._requests = []
+
+    def add(self, request, callback=None, request_id=None):
+        self._requests.append((request_id, request, callback or self._callback))
+
+    def execute(self):
+        for request_id, request, callback in self._requests:
+            try:
+                response, exception = request.execute(), None
+            except HttpError as error:
+                response, exception = None, error
+            callback(request_id, response, exception)
+
+
 def create_mock_service():
     service = MagicMock()
+    service.new_batch_http_request.side_effect = lambda callback=None: FakeBatch(callback)
 
     channels_list = MagicMock()
     channels_list.execute.return_value = {"items": [MOCK_CHANNEL]}
@@ -242,6 +264,25 @@ def mock_service():
     return create_mock_service()
 
 
+@pytest.fixture(autouse=True)
+def _isolate_config(tmp_path, monkeypatch):
+    # Commands persist per-profile metadata; keep it out of the real config dir.
+    config_dir = tmp_path / "isolated-config"
+    monkeypatch.delenv(_config_module.PROFILE_ENV_VAR, raising=False)
+    monkeypatch.setattr(_config_module, "CONFIG_DIR", config_dir)
+    monkeypatch.setattr(_config_module, "CLIENT_SECRETS_FILE", config_dir / "client_secrets.json")
+    monkeypatch.setattr(_config_module, "PROFILES_DIR", config_dir / "profiles")
+    monkeypatch.setattr(_config_module, "STATE_FILE", config_dir / "state.json")
+    monkeypatch.setattr(_config_module, "LEGACY_CREDENTIALS_FILE", config_dir / "credentials.json")
+
+
+@pytest.fixture(autouse=True)
+def _isolate_cache(tmp_path, monkeypatch):
+    # Cached analytics responses must not leak between tests or into ~/.cache.
+    monkeypatch.delenv(_cache_module.TTL_ENV_VAR, raising=False)
+    monkeypatch.setattr(_cache_module, "CACHE_DIR", tmp_path / "isolated-cache")
+
+
 @pytest.fixture(autouse=True)
 def _clear_playlists_caches():
     _playlists_module._uploads_id_cache.clear()
@@ -249,6 +290,15 @@ def _clear_playlists_caches():
     _playlists_module._uploads_id_cache.clear()
 
 
+@pytest.fixture(autouse=True)
+def _clear_api_caches():
+    _api_module._credentials_cache.clear()
+    _api_module._service_cache.clear()
+    yield
+    _api_module._credentials_cache.clear()
+    _api_module._service_cache.clear()
+
+
 @pytest.fixture
 def mock_auth(mock_service):
     mock_creds = MagicMock()
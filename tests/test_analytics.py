@@ -1,17 +1,24 @@
 import json
+from datetime import date
 from unittest.mock import MagicMock, patch
 
 import pytest
 import typer
+from rich.cells import cell_len
 from typer.testing import CliRunner
 
+from ytstudio import cache
 from ytstudio.commands.analytics import (
     _align_date_range,
+    _cell_formatter,
+    _date_range,
     _fetch_snippet_titles,
     _resolve_query_dimension_titles,
+    _rows_as,
 )
 from ytstudio.main import app
-from ytstudio.ui import format_number, set_raw_output
+from ytstudio.services import store_channel_id
+from ytstudio.ui import PLAIN_TABLE_ROWS, format_number, set_raw_output
 
 runner = CliRunner()
 
@@ -34,6 +41,7 @@ class TestFormatNumber:
         assert format_number(999) == "999"
         assert format_number(1500) == "1.5K"
         assert format_number(2500000) == "2.5M"
+        assert format_number(3_200_000_000) == "3.2B"
 
     def test_raw_mode(self):
         set_raw_output(True)
@@ -124,10 +132,17 @@ class TestAnalyticsCommands:
         data_service.channels.return_value.list.return_value.execute.return_value = {
             "items": [{"id": "UC_test"}]
         }
-        analytics_service.reports.return_value.query.return_value.execute.side_effect = [
-            self._overview_response(current_row),
-            self._overview_response(previous_row),
-        ]
+
+        # The two windows are fetched concurrently: answer by date, not call order.
+        def query(**params):
+            request = MagicMock()
+            current = params["endDate"] == date.today().isoformat()
+            request.execute.return_value = self._overview_response(
+                current_row if current else previous_row
+            )
+            return request
+
+        analytics_service.reports.return_value.query.side_effect = query
         return data_service, analytics_service
 
     def test_overview_compare_deltas_table(self):
@@ -176,8 +191,11 @@ class TestAnalyticsCommands:
             assert result.exit_code == 0
 
         calls = analytics_svc.reports.return_value.query.call_args_list
-        current_start = calls[0].kwargs["startDate"]
-        previous_end = calls[1].kwargs["endDate"]
+        current, previous = sorted(
+            (c.kwargs for c in calls), key=lambda q: q["endDate"], reverse=True
+        )
+        current_start = current["startDate"]
+        previous_end = previous["endDate"]
         assert previous_end < current_start
 
     def test_overview_no_compare(self):
@@ -209,14 +227,109 @@ class TestAnalyticsCommands:
             payload = json.loads(result.output)
             assert payload["pct_change"]["views"] is None
 
+    def test_overview_rerun_served_from_cache(self):
+        data_svc, analytics_svc = self._mock_overview_services()
+        execute = analytics_svc.reports.return_value.query.return_value.execute
+        with (
+            patch("ytstudio.commands.analytics.get_data_service", return_value=data_svc),
+            patch("ytstudio.commands.analytics.get_analytics_service", return_value=analytics_svc),
+        ):
+            args = ["analytics", "overview", "--no-compare"]
+            assert runner.invoke(app, args).exit_code == 0
+            assert runner.invoke(app, [*args, "-o", "json"]).exit_code == 0
+            assert execute.call_count == 1
+
+            assert runner.invoke(app, [*args, "--no-cache"]).exit_code == 0
+            assert execute.call_count == 2
+
     def test_video_not_found(self, mock_auth):
         mock_auth.videos.return_value.list.return_value.execute.return_value = {"items": []}
         with (
             patch("ytstudio.commands.analytics.get_data_service", return_value=mock_auth),
-            patch("ytstudio.commands.analytics.get_analytics_service", return_value=mock_auth),
+            patch(
+                "ytstudio.commands.analytics.get_analytics_service", return_value=mock_auth
+            ) as get_analytics_service,
         ):
             result = runner.invoke(app, ["analytics", "video", "nonexistent"])
             assert result.exit_code == 1
+            get_analytics_service.assert_not_called()
+
+    def test_video_batches_channel_and_video_lookup(self, mock_auth):
+        mock_auth.reports.return_value.query.return_value.execute.return_value = {
+            "columnHeaders": [
+                {"name": "views"},
+                {"name": "estimatedMinutesWatched"},
+                {"name": "averageViewDuration"},
+                {"name": "averageViewPercentage"},
+                {"name": "likes"},
+                {"name": "comments"},
+            ],
+            "rows": [[1200, 300, 95, 41.5, 60, 7]],
+        }
+        with (
+            patch("ytstudio.commands.analytics.get_data_service", return_value=mock_auth),
+            patch("ytstudio.commands.analytics.get_analytics_service", return_value=mock_auth),
+        ):
+            result = runner.invoke(app, ["analytics", "video", "test_video_123", "-o", "json"])
+
+        assert result.exit_code == 0
+        payload = json.loads(result.output)
+        assert payload["video"]["id"] == "test_video_123"
+        assert payload["analytics"]["views"] == 1200
+        mock_auth.new_batch_http_request.assert_called_once()
+        # the channel id came from the batch, not a separate round trip
+        assert mock_auth.channels.return_value.list.return_value.execute.call_count == 1
+        query = mock_auth.reports.return_value.query.call_args.kwargs
+        assert query["ids"] == "channel==UC_test_channel_id"
+
+    def test_video_with_known_channel_overlaps_lookup_and_query(self, mock_auth):
+        store_channel_id("UC_stored")
+        mock_auth.reports.return_value.query.return_value.execute.return_value = {
+            "columnHeaders": [{"name": "views"}],
+            "rows": [[1200]],
+        }
+        with (
+            patch("ytstudio.commands.analytics.get_data_service", return_value=mock_auth),
+            patch("ytstudio.commands.analytics.get_analytics_service", return_value=mock_auth),
+        ):
+            result = runner.invoke(app, ["analytics", "video", "test_video_123", "-o", "json"])
+
+        assert result.exit_code == 0
+        assert json.loads(result.output)["analytics"]["views"] == 1200
+        mock_auth.channels.return_value.list.assert_not_called()
+        mock_auth.new_batch_http_request.assert_not_called()
+        query = mock_auth.reports.return_value.query.call_args.kwargs
+        assert query["ids"] == "channel==UC_stored"
+
+    def test_video_with_known_channel_not_found(self, mock_auth):
+        store_channel_id("UC_stored")
+        mock_auth.videos.return_value.list.return_value.execute.return_value = {"items": []}
+        with (
+            patch("ytstudio.commands.analytics.get_data_service", return_value=mock_auth),
+            patch("ytstudio.commands.analytics.get_analytics_service", return_value=mock_auth),
+        ):
+            result = runner.invoke(app, ["analytics", "video", "nonexistent"])
+
+        assert result.exit_code == 1
+        assert "Video not found" in result.output
+        # The report for an unknown video is dropped, not cached under its id.
+        assert not (cache.CACHE_DIR / "analytics").exists()
+
+    def test_video_with_known_channel_caches_report_for_existing_video(self, mock_auth):
+        store_channel_id("UC_stored")
+        execute = mock_auth.reports.return_value.query.return_value.execute
+        execute.return_value = {"columnHeaders": [{"name": "views"}], "rows": [[1200]]}
+        with (
+            patch("ytstudio.commands.analytics.get_data_service", return_value=mock_auth),
+            patch("ytstudio.commands.analytics.get_analytics_service", return_value=mock_auth),
+        ):
+            args = ["analytics", "video", "test_video_123", "-o", "json"]
+            assert runner.invoke(app, args).exit_code == 0
+            result = runner.invoke(app, args)
+
+        assert result.exit_code == 0
+        assert json.loads(result.output)["analytics"]["views"] == 1200
+        assert execute.call_count == 1
 
     def test_not_authenticated(self):
         with patch(
@@ -257,6 +370,47 @@ class TestQueryCommand:
             assert result.exit_code == 0
             assert "2026-01-01" in result.output
 
+    def test_query_long_table_is_plain_aligned_text(self):
+        data_svc, analytics_svc = self._mock_services()
+        rows = [[f"2026-01-{i % 28 + 1:02d}", i * 10, i] for i in range(PLAIN_TABLE_ROWS + 1)]
+        analytics_svc.reports.return_value.query.return_value.execute.return_value = {
+            **MOCK_QUERY_RESPONSE,
+            "rows": rows,
+        }
+        with (
+            patch("ytstudio.commands.analytics.get_data_service", return_value=data_svc),
+            patch("ytstudio.commands.analytics.get_analytics_service", return_value=analytics_svc),
+        ):
+            result = runner.invoke(app, ["analytics", "query", "-m", "views,likes", "-d", "day"])
+
+        assert result.exit_code == 0
+        lines = result.output.splitlines()
+        assert lines[0].split() == ["day", "views", "likes"]
+        assert len(lines) == len(rows) + 1
+        # metric columns are right-aligned
+        assert len(lines[1]) == len(lines[-1])
+
+    def test_query_long_table_aligns_wide_dimension_values(self):
+        data_svc, analytics_svc = self._mock_services()
+        cities = ["東京", *(f"City {i}" for i in range(PLAIN_TABLE_ROWS))]
+        analytics_svc.reports.return_value.query.return_value.execute.return_value = {
+            "columnHeaders": [
+                {"name": "city", "columnType": "DIMENSION", "dataType": "STRING"},
+                {"name": "views", "columnType": "METRIC", "dataType": "INTEGER"},
+            ],
+            "rows": [[city, 10] for city in cities],
+        }
+        with (
+            patch("ytstudio.commands.analytics.get_data_service", return_value=data_svc),
+            patch("ytstudio.commands.analytics.get_analytics_service", return_value=analytics_svc),
+        ):
+            result = runner.invoke(app, ["analytics", "query", "-m", "views", "-d", "city"])
+
+        assert result.exit_code == 0
+        lines = result.output.splitlines()
+        assert lines[1].startswith("東京")
+        assert cell_len(lines[1]) == cell_len(lines[-1])
+
     def test_query_json_output(self):
         data_svc, analytics_svc = self._mock_services()
         with (
@@ -273,6 +427,56 @@ class TestQueryCommand:
             assert data[0]["day"] == "2026-01-01"
             assert data[0]["views"] == 1500
 
+    def test_query_json_columns_output(self):
+        data_svc, analytics_svc = self._mock_services()
+        with (
+            patch("ytstudio.commands.analytics.get_data_service", return_value=data_svc),
+            patch("ytstudio.commands.analytics.get_analytics_service", return_value=analytics_svc),
+        ):
+            result = runner.invoke(
+                app,
+                ["analytics", "query", "-m", "views,likes", "-d", "day", "-o", "json-columns"],
+            )
+        assert result.exit_code == 0
+        assert json.loads(result.output) == {
+            "columnHeaders": ["day", "views", "likes"],
+            "rows": MOCK_QUERY_RESPONSE["rows"],
+        }
+
+    def test_query_daily_breakdown_through_today_is_not_cached(self):
+        data_svc, analytics_svc = self._mock_services()
+        execute = analytics_svc.reports.return_value.query.return_value.execute
+        with (
+            patch("ytstudio.commands.analytics.get_data_service", return_value=data_svc),
+            patch("ytstudio.commands.analytics.get_analytics_service", return_value=analytics_svc),
+        ):
+            args = ["analytics", "query", "-m", "views", "-d", "day"]
+            assert runner.invoke(app, args).exit_code == 0
+            assert runner.invoke(app, args).exit_code == 0
+            assert execute.call_count == 2
+            # Not written either, so no other command can serve the partial day.
+            assert not (cache.CACHE_DIR / "analytics").exists()
+
+            past = [*args, "--start", "2026-01-01", "--end", "2026-01-31"]
+            assert runner.invoke(app, past).exit_code == 0
+            assert runner.invoke(app, past).exit_code == 0
+            assert execute.call_count == 3
+
+    def test_query_cache_ttl_option(self):
+        data_svc, analytics_svc = self._mock_services()
+        execute = analytics_svc.reports.return_value.query.return_value.execute
+        with (
+            patch("ytstudio.commands.analytics.get_data_service", return_value=data_svc),
+            patch("ytstudio.commands.analytics.get_analytics_service", return_value=analytics_svc),
+        ):
+            args = ["analytics", "query", "-m", "views", "-d", "country"]
+            assert runner.invoke(app, args).exit_code == 0
+            assert runner.invoke(app, args).exit_code == 0
+            assert execute.call_count == 1
+
+            assert runner.invoke(app, [*args, "--cache-ttl", "0"]).exit_code == 0
+            assert execute.call_count == 2
+
     def test_query_csv_output(self):
         data_svc, analytics_svc = self._mock_services()
         with (
@@ -513,6 +717,18 @@ class TestQueryCommand:
             assert result.exit_code == 1
             assert "Invalid filter" in result.output
 
+    @pytest.mark.parametrize("bad", ["==abc", "video=="])
+    def test_query_filter_needs_key_and_value(self, bad):
+        data_svc, analytics_svc = self._mock_services()
+        with (
+            patch("ytstudio.commands.analytics.get_data_service", return_value=data_svc),
+            patch("ytstudio.commands.analytics.get_analytics_service", return_value=analytics_svc),
+        ):
+            result = runner.invoke(app, ["analytics", "query", "-m", "views", "-f", bad])
+        assert result.exit_code == 1
+        assert "Invalid filter" in result.output
+        analytics_svc.reports.return_value.query.assert_not_called()
+
 
 class TestMetricsCommand:
     def test_list_all(self):
@@ -527,6 +743,12 @@ class TestMetricsCommand:
         assert "likes" in result.output
         assert "shares" in result.output
 
+    def test_list_json_shape(self):
+        result = runner.invoke(app, ["analytics", "metrics", "--group", "engagement", "-o", "json"])
+        assert result.exit_code == 0
+        likes = next(m for m in json.loads(result.output) if m["name"] == "likes")
+        assert list(likes) == ["name", "description", "group", "core", "monetary"]
+
     def test_list_invalid_group(self):
         result = runner.invoke(app, ["analytics", "metrics", "--group", "nonexistent"])
         assert result.exit_code == 1
@@ -570,6 +792,39 @@ class TestDimensionsCommand:
         assert any(d["name"] == "country" for d in data)
 
 
+class TestDateRange:
+    def test_window_ends_today(self):
+        assert _date_range(7, date(2026, 3, 10)) == ("2026-03-03", "2026-03-10")
+
+    def test_offset_window_ends_before_current_one(self):
+        assert _date_range(7, date(2026, 3, 10), offset=8) == ("2026-02-23", "2026-03-02")
+
+
+class TestRowsAs:
+    def test_reorders_and_defaults_missing_fields(self):
+        response = {
+            "columnHeaders": [{"name": "likes"}, {"name": "views"}],
+            "rows": [[3, 100], [4, 200]],
+        }
+        assert _rows_as(("views", "likes", "comments"), response) == [(100, 3, 0), (200, 4, 0)]
+
+    def test_no_rows(self):
+        assert _rows_as(("views",), {"columnHeaders": [{"name": "views"}]}) == []
+
+
+class TestCellFormatter:
+    def test_header_picks_float_format(self):
+        assert _cell_formatter("averageViewPercentage")(41.456) == "41.46%"
+        assert _cell_formatter("cpm")(3.5) == "$3.50"
+        assert _cell_formatter("averageViewDuration")(95.25) == "95.2"
+
+    def test_integers_and_whole_floats_use_format_number(self):
+        fmt = _cell_formatter("views")
+        assert fmt(1500) == "1.5K"
+        assert fmt(2000.0) == "2.0K"
+        assert fmt("2026-01-01") == "2026-01-01"
+
+
 class TestAlignDateRange:
     def test_month_snaps_start_down(self):
         assert _align_date_range(["month"], "2026-04-17", "2026-06-01") == (
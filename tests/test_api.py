@@ -1,15 +1,24 @@
+import time
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import httplib2
 import pytest
 from google.auth.exceptions import RefreshError
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.errors import HttpError
+from googleapiclient.model import JsonModel
 from oauthlib.oauth2 import AccessDeniedError, OAuth2Error
 from typer import Exit
 from typer.testing import CliRunner
 
+from tests.conftest import FakeBatch
 from ytstudio import api as api_module
-from ytstudio.api import api, get_authenticated_service, handle_api_error
+from ytstudio.api import api, api_batch, get_authenticated_service, handle_api_error
+from ytstudio.config import load_profile_meta, save_profile_meta
 from ytstudio.main import app, cli
+from ytstudio.services import load_channel_id, load_uploads_playlist_id
 
 runner = CliRunner()
 
@@ -65,6 +74,44 @@ class TestApi:
             api(request)
 
 
+class TestApiBatch:
+    def _service(self):
+        service = MagicMock()
+        service.new_batch_http_request.side_effect = lambda callback=None: FakeBatch(callback)
+        return service
+
+    def test_returns_responses_by_request_id(self):
+        first, second = MagicMock(), MagicMock()
+        first.execute.return_value = {"items": [1]}
+        second.execute.return_value = {"items": [2]}
+
+        responses = api_batch(self._service(), {"a": first, "b": second})
+
+        assert responses == {"a": {"items": [1]}, "b": {"items": [2]}}
+
+    def test_failed_sub_request_is_handled_like_api(self):
+        failing = MagicMock()
+        failing.execute.side_effect = make_http_error(403, "quotaExceeded")
+
+        with pytest.raises(SystemExit):
+            api_batch(self._service(), {"a": failing})
+
+
+class TestWithOwnConnection:
+    def test_swaps_in_a_fresh_connection_with_the_same_credentials(self):
+        credentials = MagicMock()
+        shared = AuthorizedHttp(credentials, http=httplib2.Http())
+        request = MagicMock()
+        request.http = shared
+
+        assert api_module.with_own_connection(request) is request
+        assert request.http is not shared
+        assert request.http.http is not shared.http
+        assert request.http.credentials is credentials
+        assert request.http.http.timeout is not None
+        assert 308 not in request.http.http.redirect_codes
+
+
 class TestGetCredentials:
     def test_returns_none_when_profile_has_no_credentials(self):
         with patch("ytstudio.api.load_credentials", return_value=None):
@@ -83,17 +130,73 @@ class TestGetCredentials:
         credentials.expired = True
         credentials.refresh_token = "refresh-token"
         credentials.token = "new-token"
+        credentials.expiry = datetime(2026, 1, 1, 13, 0)
 
         with (
             patch("ytstudio.api.load_credentials", return_value=creds_data),
             patch("ytstudio.api.Credentials", return_value=credentials),
-            patch("ytstudio.api.Request", return_value="request"),
+            patch("google.auth.transport.requests.Request", return_value="request"),
             patch("ytstudio.api.save_credentials") as save_credentials,
         ):
             assert api_module.get_credentials("work") is credentials
 
         credentials.refresh.assert_called_once_with("request")
-        save_credentials.assert_called_once_with({**creds_data, "token": "new-token"}, "work")
+        save_credentials.assert_called_once_with(
+            {**creds_data, "token": "new-token", "expiry": "2026-01-01T13:00:00"}, "work"
+        )
+
+    def test_restores_persisted_expiry(self):
+        creds_data = {"token": "ok", "expiry": "2999-01-01T00:00:00"}
+        with patch("ytstudio.api.load_credentials", return_value=creds_data):
+            credentials = api_module.get_credentials("work")
+
+        assert credentials.expiry == datetime(2999, 1, 1)
+        assert not credentials.expired
+
+    def test_token_close_to_expiry_is_refreshed_in_background(self):
+        soon = datetime.now(UTC).replace(tzinfo=None) + timedelta(minutes=6)
+        creds_data = {"token": "ok", "refresh_token": "refresh", "expiry": soon.isoformat()}
+        with (
+            patch("ytstudio.api.load_credentials", return_value=creds_data),
+            patch("ytstudio.api._refresh_in_background") as refresh_in_background,
+        ):
+            credentials = api_module.get_credentials("work")
+
+        assert credentials.token == "ok"
+        refresh_in_background.assert_called_once_with(creds_data, "work")
+
+    def test_background_refresh_saves_new_token(self):
+        creds_data = {"token": "old", "refresh_token": "refresh"}
+
+        def fake_refresh(self, request):
+            self.token = "new"
+
+        with (
+            patch("ytstudio.api.Credentials.refresh", fake_refresh),
+            patch("ytstudio.api.save_credentials") as save_credentials,
+            patch("ytstudio.api.atexit.register") as register,
+        ):
+            api_module._refresh_in_background(creds_data, "work")
+            # The refresh is joined at interpreter exit rather than abandoned.
+            join, timeout = register.call_args.args
+            assert timeout == api_module.PREFRESH_EXIT_WAIT
+            join(timeout)
+
+        save_credentials.assert_called_once_with({**creds_data, "token": "new"}, "work")
+
+    def test_reuses_valid_credentials_within_process(self):
+        credentials = MagicMock()
+        credentials.expired = False
+        credentials.expiry = None
+
+        with (
+            patch("ytstudio.api.load_credentials", return_value={"token": "ok"}) as load,
+            patch("ytstudio.api.Credentials", return_value=credentials),
+        ):
+            assert api_module.get_credentials("work") is credentials
+            assert api_module.get_credentials("work") is credentials
+
+        load.assert_called_once_with("work")
 
     def test_refresh_error_exits(self):
         credentials = MagicMock()
@@ -123,7 +226,68 @@ class TestGetAuthenticatedService:
             get_authenticated_service("youtube", "v3", profile="work")
 
         get_creds.assert_called_once_with("work")
-        build.assert_called_once_with("youtube", "v3", credentials=credentials)
+        build.assert_called_once()
+        args, kwargs = build.call_args
+        assert args == ("youtube", "v3")
+        assert kwargs["http"].credentials is credentials
+        assert kwargs["http"].http.timeout is not None
+        # 308 is a resumable upload's "Resume Incomplete", not a redirect.
+        assert 308 not in kwargs["http"].http.redirect_codes
+        assert kwargs["cache_discovery"] is False
+        assert kwargs["static_discovery"] is True
+
+    def test_only_data_api_gets_per_profile_http_cache(self):
+        with (
+            patch("ytstudio.api.get_credentials", return_value=MagicMock()),
+            patch("ytstudio.api.build") as build,
+        ):
+            get_authenticated_service("youtube", "v3", profile="work")
+            get_authenticated_service("youtubeAnalytics", "v2", profile="work")
+
+        data_http, analytics_http = (c.kwargs["http"].http for c in build.call_args_list)
+        assert Path(data_http.cache.cache).parts[-2:] == ("http", "work")
+        assert analytics_http.cache is None
+
+    def test_reuses_built_service_for_same_credentials(self):
+        credentials = MagicMock()
+        with (
+            patch("ytstudio.api.get_credentials", return_value=credentials),
+            patch("ytstudio.api.build") as build,
+        ):
+            first = get_authenticated_service("youtube", "v3")
+            second = get_authenticated_service("youtube", "v3")
+            get_authenticated_service("youtubeAnalytics", "v2")
+
+        assert first is second
+        assert build.call_count == 2
+
+    def test_rebuilds_service_for_new_credentials(self):
+        with (
+            patch("ytstudio.api.get_credentials", side_effect=[MagicMock(), MagicMock()]),
+            patch("ytstudio.api.build") as build,
+        ):
+            get_authenticated_service("youtube", "v3")
+            get_authenticated_service("youtube", "v3")
+
+        assert build.call_count == 2
+
+
+class TestOrjsonModel:
+    def test_is_the_response_model_when_orjson_is_installed(self):
+        # orjson is a dev dependency, so the decode path always runs here.
+        assert isinstance(api_module.RESPONSE_MODEL, api_module._OrjsonModel)
+
+    def test_decodes_like_stdlib_json_model(self):
+        model = api_module._OrjsonModel()
+        stock = JsonModel()
+        for body in (b'{"items": [{"id": "x", "title": "caf\\u00e9"}]}', b"[]", b"not json"):
+            assert model.deserialize(body) == stock.deserialize(body)
+        # Non-JSON bodies fall back to the stock behaviour (returned as text).
+        assert model.deserialize(b"not json") == "not json"
+
+    def test_unwraps_data_envelope(self):
+        model = api_module._OrjsonModel(data_wrapper=True)
+        assert model.deserialize(b'{"data": {"id": "x"}}') == {"id": "x"}
 
 
 class TestStatus:
@@ -156,8 +320,91 @@ class TestStatus:
             api_module.get_status("work")
 
         service.channels.return_value.list.assert_called_once_with(
-            part="snippet,statistics", mine=True
+            part="snippet,statistics", mine=True, fields=api_module.CHANNEL_FIELDS
+        )
+        meta = load_profile_meta("work")
+        assert (meta["title"], meta["subscriber_count"], meta["video_count"]) == (
+            "Channel",
+            "10",
+            "2",
+        )
+
+    def test_get_status_uses_fresh_stats_from_profile_meta(self, capsys):
+        credentials = MagicMock()
+        credentials.valid = True
+        save_profile_meta(
+            "work",
+            {
+                "title": "Stored Channel",
+                "subscriber_count": "42",
+                "video_count": "7",
+                "stats_fetched_at": time.time(),
+            },
         )
+        with (
+            patch("ytstudio.api.get_credentials", return_value=credentials),
+            patch("ytstudio.api.build") as build,
+        ):
+            api_module.get_status("work")
+
+        build.assert_not_called()
+        out = capsys.readouterr().out
+        assert "Stored Channel" in out
+        assert "42" in out
+
+    def test_get_status_refreshes_stale_stats(self):
+        credentials = MagicMock()
+        credentials.valid = True
+        save_profile_meta(
+            "work", {"title": "Old", "stats_fetched_at": 0, "uploads_playlist_id": "UU"}
+        )
+        service = MagicMock()
+        service.channels.return_value.list.return_value.execute.return_value = {
+            "items": [{"id": "UC1", "snippet": {"title": "New"}, "statistics": {}}]
+        }
+        with (
+            patch("ytstudio.api.get_credentials", return_value=credentials),
+            patch("ytstudio.api.build", return_value=service),
+        ):
+            api_module.get_status("work")
+
+        meta = load_profile_meta("work")
+        assert meta["title"] == "New"
+        assert meta["uploads_playlist_id"] == "UU"
+
+    def test_get_status_after_relogin_with_unknown_channel_refetches(self, capsys):
+        save_profile_meta("work", {"title": "Old", "stats_fetched_at": time.time()})
+        with patch("ytstudio.api._fetch_channel_info", return_value=None):
+            api_module._show_login_success(MagicMock(), "work")
+
+        credentials = MagicMock()
+        credentials.valid = True
+        service = MagicMock()
+        service.channels.return_value.list.return_value.execute.return_value = {
+            "items": [{"id": "UC1", "snippet": {"title": "New"}, "statistics": {}}]
+        }
+        with (
+            patch("ytstudio.api.get_credentials", return_value=credentials),
+            patch("ytstudio.api.build", return_value=service),
+        ):
+            api_module.get_status("work")
+
+        out = capsys.readouterr().out
+        assert "New" in out and "Old" not in out
+
+    def test_get_status_reuses_cached_service(self):
+        credentials = MagicMock()
+        credentials.valid = True
+        with (
+            patch("ytstudio.api.get_credentials", return_value=credentials),
+            patch("ytstudio.api.build") as build,
+        ):
+            service = api_module.get_authenticated_service("youtube", "v3", profile="work")
+            service.channels.return_value.list.return_value.execute.return_value = {"items": []}
+            api_module.get_status("work")
+
+        build.assert_called_once()
+        service.channels.return_value.list.assert_called_once()
 
 
 class TestCommands:
@@ -209,7 +456,9 @@ class TestAuthenticateLocalServer:
 
 class TestHelpers:
     def test_create_flow_uses_client_secrets_and_scopes(self):
-        with patch("ytstudio.api.InstalledAppFlow.from_client_secrets_file") as factory:
+        with patch(
+            "google_auth_oauthlib.flow.InstalledAppFlow.from_client_secrets_file"
+        ) as factory:
             assert api_module._create_flow() is factory.return_value
 
         factory.assert_called_once_with(
@@ -224,6 +473,7 @@ class TestHelpers:
             client_id="client-id",
             client_secret="client-secret",
             scopes=["scope"],
+            expiry=datetime(2026, 1, 1, 12, 0),
         )
 
         with patch("ytstudio.api.save_credentials") as save_credentials:
@@ -237,6 +487,7 @@ class TestHelpers:
                 "client_id": "client-id",
                 "client_secret": "client-secret",
                 "scopes": ["scope"],
+                "expiry": "2026-01-01T12:00:00",
             },
             "work",
         )
@@ -244,16 +495,31 @@ class TestHelpers:
     def test_fetch_channel_info_returns_channel_metadata(self):
         service = MagicMock()
         service.channels.return_value.list.return_value.execute.return_value = {
-            "items": [{"id": "UC123", "snippet": {"title": "Channel", "customUrl": "@c"}}]
+            "items": [
+                {
+                    "id": "UC123",
+                    "snippet": {"title": "Channel", "customUrl": "@c"},
+                    "statistics": {"subscriberCount": "10", "videoCount": "2"},
+                }
+            ]
         }
 
-        with patch("ytstudio.api.build", return_value=service):
+        with (
+            patch("ytstudio.api.build", return_value=service) as build,
+            patch("ytstudio.api.time.time", return_value=1000.0),
+        ):
             assert api_module._fetch_channel_info(MagicMock()) == {
                 "id": "UC123",
                 "title": "Channel",
                 "custom_url": "@c",
+                "subscriber_count": "10",
+                "video_count": "2",
+                "stats_fetched_at": 1000.0,
             }
 
+        # Same timeout-bounded transport as every other API call.
+        assert build.call_args.kwargs["http"].http.timeout is not None
+
     def test_fetch_channel_info_returns_none_when_empty_or_error(self):
         service = MagicMock()
         service.channels.return_value.list.return_value.execute.return_value = {"items": []}
@@ -273,6 +539,24 @@ class TestHelpers:
 
         save_profile_meta.assert_called_once_with("work", info)
 
+    def test_show_login_success_drops_stale_channel_meta_when_channel_unknown(self):
+        with (
+            patch("ytstudio.api._fetch_channel_info", return_value=None),
+            patch("ytstudio.api.load_profile_meta", return_value={"id": "UC_old", "title": "x"}),
+            patch("ytstudio.api.save_profile_meta") as save_profile_meta,
+        ):
+            api_module._show_login_success(MagicMock(), "work")
+
+        save_profile_meta.assert_called_once_with("work", {})
+
+    def test_relogin_with_unknown_channel_forgets_previous_uploads_playlist(self):
+        save_profile_meta("work", {"id": "UC_old", "uploads_playlist_id": "UU_old"})
+        with patch("ytstudio.api._fetch_channel_info", return_value=None):
+            api_module._show_login_success(MagicMock(), "work")
+
+        assert load_channel_id("work") is None
+        assert load_uploads_playlist_id("work") is None
+
     def test_logout_clears_credentials(self):
         with patch("ytstudio.api.clear_credentials") as clear_credentials:
             api_module.logout()
@@ -0,0 +1,82 @@
+import os
+import time
+from pathlib import Path
+
+from ytstudio import cache
+
+PARAMS = {"ids": "channel==UC1", "metrics": "views", "startDate": "2026-01-01"}
+
+
+def test_store_then_load_round_trips():
+    cache.store("analytics", PARAMS, {"rows": [[1]]})
+    assert cache.load("analytics", PARAMS) == {"rows": [[1]]}
+
+
+def test_key_ignores_param_order():
+    cache.store("analytics", PARAMS, {"rows": [[1]]})
+    assert cache.load("analytics", dict(reversed(PARAMS.items()))) == {"rows": [[1]]}
+
+
+def test_different_params_miss():
+    cache.store("analytics", PARAMS, {"rows": [[1]]})
+    assert cache.load("analytics", {**PARAMS, "metrics": "likes"}) is None
+
+
+def test_expired_entry_misses():
+    cache.store("analytics", PARAMS, {"rows": [[1]]})
+    path = cache._entry_path("analytics", PARAMS)
+    stale = time.time() - cache.ANALYTICS_TTL - 1
+    os.utime(path, (stale, stale))
+    assert cache.load("analytics", PARAMS) is None
+
+
+def test_corrupt_entry_misses():
+    cache.store("analytics", PARAMS, {"rows": [[1]]})
+    cache._entry_path("analytics", PARAMS).write_text("{not json")
+    assert cache.load("analytics", PARAMS) is None
+
+
+def test_http_cache_dir_is_private_per_profile():
+    work = Path(cache.http_cache_dir("work"))
+    assert work.is_dir() and work != Path(cache.http_cache_dir("personal"))
+    if os.name == "posix":
+        assert work.stat().st_mode & 0o777 == 0o700
+
+    cache.clear_http_cache("work")
+    assert not work.exists()
+
+
+def test_http_cache_prunes_stale_entries_once_per_interval():
+    path = Path(cache.http_cache_dir("work"))
+    stale, fresh = path / "stale", path / "fresh"
+    for entry in (stale, fresh):
+        entry.write_text("cached response")
+    old = time.time() - cache.HTTP_CACHE_MAX_AGE - 1
+    os.utime(stale, (old, old))
+    os.utime(path / ".pruned", (old, old))
+
+    cache.http_cache_dir("work")
+    assert not stale.exists() and fresh.exists()
+
+    # Pruned just now, so the next call does not scan the directory again.
+    stale.write_text("cached response")
+    os.utime(stale, (old, old))
+    cache.http_cache_dir("work")
+    assert stale.exists()
+
+
+def test_ttl_env_var_overrides_default(monkeypatch):
+    cache.store("analytics", PARAMS, {"rows": [[1]]})
+    path = cache._entry_path("analytics", PARAMS)
+    stale = time.time() - 120
+    os.utime(path, (stale, stale))
+
+    monkeypatch.setenv(cache.TTL_ENV_VAR, "60")
+    assert cache.load("analytics", PARAMS) is None
+    monkeypatch.setenv(cache.TTL_ENV_VAR, "300")
+    assert cache.load("analytics", PARAMS) == {"rows": [[1]]}
+
+
+def test_invalid_ttl_env_var_falls_back_to_default(monkeypatch):
+    monkeypatch.setenv(cache.TTL_ENV_VAR, "soon")
+    assert cache.analytics_ttl() == cache.ANALYTICS_TTL
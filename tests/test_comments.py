@@ -1,9 +1,11 @@
+import json
 from datetime import UTC, datetime, timedelta
 from unittest.mock import MagicMock
 
 from googleapiclient.errors import HttpError
 from typer.testing import CliRunner
 
+from tests.conftest import MOCK_COMMENT, MOCK_NEGATIVE_COMMENT
 from ytstudio.main import app
 from ytstudio.ui import time_ago
 
@@ -18,6 +20,10 @@ class TestTimeAgo:
         hours_ago = (datetime.now(UTC) - timedelta(hours=5)).isoformat()
         assert "5h ago" in time_ago(hours_ago)
 
+    def test_uses_given_reference_time(self):
+        now = datetime(2026, 3, 10, 12, 0, tzinfo=UTC)
+        assert time_ago("2026-03-07T12:00:00Z", now) == "3d ago"
+
 
 class TestCommentsCommands:
     def test_list_channel_wide(self, mock_auth):
@@ -49,6 +55,19 @@ class TestCommentsCommands:
         assert '"id": "UgwComment123"' in result.stdout
         assert '"author": "Test User"' in result.stdout
 
+    def test_list_follows_page_tokens_past_100(self, mock_auth):
+        thread_list = mock_auth.commentThreads.return_value.list
+        thread_list.return_value.execute.side_effect = [
+            {"items": [MOCK_COMMENT] * 100, "nextPageToken": "page2"},
+            {"items": [MOCK_NEGATIVE_COMMENT] * 100, "nextPageToken": "page3"},
+        ]
+        result = runner.invoke(app, ["comments", "list", "-n", "150", "-o", "json"])
+        assert result.exit_code == 0
+        assert len(json.loads(result.stdout)) == 150
+        calls = thread_list.call_args_list
+        assert [c.kwargs["pageToken"] for c in calls] == [None, "page2"]
+        assert [c.kwargs["maxResults"] for c in calls] == [100, 50]
+
     def test_publish_comments(self, mock_auth):
         result = runner.invoke(app, ["comments", "publish", "UgwComment123", "UgwComment456"])
         assert result.exit_code == 0
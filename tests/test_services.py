@@ -0,0 +1,72 @@
+from unittest.mock import MagicMock
+
+import pytest
+from typer import Exit
+
+from ytstudio import config
+from ytstudio.services import (
+    find_uploads_playlist_id,
+    get_channel_id,
+    get_uploads_playlist_id,
+    load_channel_id,
+    load_uploads_playlist_id,
+    store_channel_id,
+)
+
+
+def _service(items):
+    service = MagicMock()
+    service.channels.return_value.list.return_value.execute.return_value = {"items": items}
+    return service
+
+
+class TestChannelId:
+    def test_fetches_and_stores_on_first_use(self):
+        service = _service([{"id": "UC_fetched"}])
+
+        assert get_channel_id(service) == "UC_fetched"
+        assert load_channel_id() == "UC_fetched"
+
+    def test_uses_stored_id_without_api_call(self):
+        store_channel_id("UC_cached")
+        service = _service([{"id": "UC_other"}])
+
+        assert get_channel_id(service) == "UC_cached"
+        service.channels.assert_not_called()
+
+    def test_store_keeps_existing_profile_meta(self):
+        config.save_profile_meta("work", {"title": "Work channel"})
+
+        store_channel_id("UC_work", profile="work")
+
+        assert config.load_profile_meta("work") == {"title": "Work channel", "id": "UC_work"}
+
+    def test_exits_when_account_has_no_channel(self):
+        with pytest.raises(Exit):
+            get_channel_id(_service([]))
+
+
+class TestUploadsPlaylistId:
+    def test_fetches_and_stores_on_first_use(self):
+        service = _service([{"contentDetails": {"relatedPlaylists": {"uploads": "UU_fetched"}}}])
+
+        assert get_uploads_playlist_id(service) == "UU_fetched"
+        assert load_uploads_playlist_id() == "UU_fetched"
+        assert get_uploads_playlist_id(service) == "UU_fetched"
+        service.channels.return_value.list.assert_called_once()
+
+    def test_kept_alongside_channel_id(self):
+        store_channel_id("UC_1")
+        get_uploads_playlist_id(
+            _service([{"contentDetails": {"relatedPlaylists": {"uploads": "UU_1"}}}])
+        )
+
+        assert load_channel_id() == "UC_1"
+
+    def test_exits_when_account_has_no_channel(self):
+        with pytest.raises(Exit):
+            get_uploads_playlist_id(_service([]))
+
+    def test_find_returns_none_when_account_has_no_channel(self):
+        assert find_uploads_playlist_id(_service([])) is None
+        assert load_uploads_playlist_id() is None
@@ -0,0 +1,44 @@
+import io
+import json
+import sys
+from dataclasses import dataclass
+
+from ytstudio import ui
+
+
+@dataclass
+class _Row:
+    title: str
+    views: int
+
+
+class TestPrintJson:
+    def test_output_does_not_depend_on_orjson(self, capsys, monkeypatch):
+        assert ui.orjson is not None  # a dev dependency, so both paths are exercised
+        data = {"rows": [_Row("日本語 ✓ café", 12)], "ratio": 0.25, "empty": None}
+
+        ui.print_json(data)
+        with_orjson = capsys.readouterr().out
+        monkeypatch.setattr(ui, "orjson", None)
+        ui.print_json(data)
+        stdlib = capsys.readouterr().out
+
+        assert with_orjson == stdlib
+        assert "日本語 ✓ café" in stdlib
+
+    def test_stdlib_path_writes_utf8_to_non_utf8_stdout(self, monkeypatch):
+        raw = io.BytesIO()
+        monkeypatch.setattr(sys, "stdout", io.TextIOWrapper(raw, encoding="cp1252"))
+        monkeypatch.setattr(ui, "orjson", None)
+
+        ui.print_json({"title": "日本語 🎬"})
+
+        assert json.loads(raw.getvalue().decode()) == {"title": "日本語 🎬"}
+
+    def test_writes_text_to_stdout_without_buffer(self, monkeypatch):
+        out = io.StringIO()
+        monkeypatch.setattr(sys, "stdout", out)
+
+        ui.print_json({"title": "café"})
+
+        assert json.loads(out.getvalue()) == {"title": "café"}
@@ -87,7 +87,7 @@ def test_upload_execute_surfaces_video_id_when_write_back_fails(tmp_path, mock_a
     with (
         patch("ytstudio.upload_pipeline.MediaFileUpload"),
         patch(
-            "ytstudio.commands.upload.write_back",
+            "ytstudio.upload_pipeline.write_back",
             side_effect=OSError("disk full"),
         ),
     ):
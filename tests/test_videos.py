@@ -1,10 +1,17 @@
+import csv
+import io
 import json
 from unittest.mock import MagicMock, patch
 
 import typer
+from googleapiclient.errors import HttpError
+from rich.cells import cell_len
 from typer.testing import CliRunner
 
+from tests.conftest import FakeBatch
+from ytstudio.commands.videos import Video
 from ytstudio.main import app
+from ytstudio.ui import PLAIN_TABLE_ROWS
 
 runner = CliRunner()
 
@@ -25,6 +32,14 @@ def make_search_video(video_id, title, description=""):
     }
 
 
+def _http_error(status: int, reason: str) -> HttpError:
+    resp = MagicMock()
+    resp.status = status
+    err = HttpError(resp=resp, content=b"{}")
+    err.error_details = [{"reason": reason}]
+    return err
+
+
 def setup_search_mock(mock_service, videos):
     """Configure the search and videos.list mocks for search-replace tests"""
     search_list = MagicMock()
@@ -44,10 +59,66 @@ class TestVideosCommands:
         assert result.exit_code == 0
         assert "Test Video Title" in result.stdout
 
+    def test_list_requests_only_used_parts_and_fields(self, mock_auth):
+        result = runner.invoke(app, ["videos", "list"])
+        assert result.exit_code == 0
+        playlist_kwargs = mock_auth.playlistItems.return_value.list.call_args.kwargs
+        assert playlist_kwargs["part"] == "snippet"
+        assert "resourceId/videoId" in playlist_kwargs["fields"]
+        videos_kwargs = mock_auth.videos.return_value.list.call_args.kwargs
+        assert videos_kwargs["fields"].startswith("items(id,statistics(")
+
+    def test_list_csv_quotes_titles(self, mock_auth):
+        page = mock_auth.playlistItems.return_value.list.return_value.execute.return_value
+        item = page["items"][0]
+        page["items"] = [{**item, "snippet": {**item["snippet"], "title": 'Say "hi", world'}}]
+        result = runner.invoke(app, ["videos", "list", "-o", "csv"])
+        assert result.exit_code == 0
+        rows = list(csv.reader(io.StringIO(result.stdout)))
+        assert rows[0] == ["id", "title", "views", "likes", "comments", "privacy", "published_at"]
+        assert rows[1][:3] == ["test_video_123", 'Say "hi", world', "10000"]
+
+    def test_list_long_output_is_plain_aligned_text(self, mock_auth):
+        videos = [
+            Video(f"vid{i:03d}", f"Title {i}", "", "2026-01-15T10:00:00Z", i * 1000, i, 0, "", "")
+            for i in range(PLAIN_TABLE_ROWS + 1)
+        ]
+        result_page = {"videos": videos, "next_page_token": None, "total_results": len(videos)}
+        with patch("ytstudio.commands.videos.fetch_videos", return_value=result_page):
+            result = runner.invoke(app, ["videos", "list", "-n", "101"])
+        assert result.exit_code == 0
+        lines = result.stdout.splitlines()
+        assert lines[0].split() == ["ID", "Title", "URL", "Views", "Likes", "Comments", "Published"]
+        assert len(lines) == len(videos) + 1
+        # Numeric columns are right-aligned, so every row ends at the same offset.
+        assert lines[1].index("2026-01-15") == lines[-1].index("2026-01-15")
+        assert "100.0K" in lines[-1]
+
+    def test_list_long_output_aligns_wide_characters(self, mock_auth):
+        titles = ["日本語のタイトル", *(f"Title {i}" for i in range(PLAIN_TABLE_ROWS))]
+        videos = [
+            Video(f"vid{i:03d}", title, "", "2026-01-15T10:00:00Z", i, 0, 0, "", "")
+            for i, title in enumerate(titles)
+        ]
+        result_page = {"videos": videos, "next_page_token": None, "total_results": len(videos)}
+        with patch("ytstudio.commands.videos.fetch_videos", return_value=result_page):
+            result = runner.invoke(app, ["videos", "list", "-n", "101"])
+        assert result.exit_code == 0
+        lines = result.stdout.splitlines()
+        assert "日本語のタイトル" in lines[1]
+
+        def published_column(line):
+            return cell_len(line[: line.index("2026-01-15")])
+
+        assert published_column(lines[1]) == published_column(lines[-1])
+
     def test_get(self, mock_auth):
         result = runner.invoke(app, ["videos", "show", "test_video_123"])
         assert result.exit_code == 0
         assert "Test Video Title" in result.stdout
+        fields = mock_auth.videos.return_value.list.call_args.kwargs["fields"]
+        assert "snippet(title,description," in fields
+        assert "thumbnails" not in fields
 
     def test_get_not_found(self, mock_auth):
         mock_auth.videos.return_value.list.return_value.execute.return_value = {"items": []}
@@ -111,15 +182,15 @@ class TestVideosCommands:
                     "snippet": {
                         "title": "Scheduled Drop",
                         "publishedAt": "2026-01-01T00:00:00Z",
+                        "resourceId": {"videoId": "scheduled_vid"},
                     },
-                    "contentDetails": {"videoId": "scheduled_vid"},
                 },
                 {
                     "snippet": {
                         "title": "Public Already",
                         "publishedAt": "2025-01-01T00:00:00Z",
+                        "resourceId": {"videoId": "public_vid"},
                     },
-                    "contentDetails": {"videoId": "public_vid"},
                 },
             ],
             "nextPageToken": None,
@@ -246,6 +317,84 @@ class TestSearchReplace:
         assert "1 updated" in result.stdout
         mock_auth.videos.return_value.update.assert_called_once()
 
+    def test_execute_rereads_snippets_in_one_batch(self, mock_auth):
+        videos = [make_search_video(f"vid{i}", f"OLDNAME Episode {i}") for i in range(3)]
+        setup_search_mock(mock_auth, videos)
+
+        result = runner.invoke(
+            app,
+            ["videos", "search-replace", "-s", "OLDNAME", "-r", "New", "-f", "title", "--execute"],
+        )
+        assert result.exit_code == 0
+        assert "3 updated" in result.stdout
+        list_ids = [c.kwargs["id"] for c in mock_auth.videos.return_value.list.call_args_list]
+        # one scan lookup plus one pre-update re-read, not one re-read per video
+        assert list_ids == ["vid0,vid1,vid2", "vid0,vid1,vid2"]
+        assert mock_auth.videos.return_value.update.call_count == 3
+
+    def test_execute_tallies_failures_and_stops_on_quota(self, mock_auth):
+        videos = [make_search_video(f"vid{i}", f"OLDNAME Episode {i}") for i in range(4)]
+        setup_search_mock(mock_auth, videos)
+        mock_auth.videos.return_value.update.return_value.execute.side_effect = [
+            {},
+            _http_error(400, "invalidTitle"),
+            _http_error(403, "quotaExceeded"),
+            {},
+        ]
+
+        result = runner.invoke(
+            app,
+            ["videos", "search-replace", "-s", "OLDNAME", "-r", "New", "-f", "title", "--execute"],
+        )
+        assert result.exit_code == 1
+        assert "Partial progress:" in result.stdout
+        # vid3 was in the same batch as the quota error, so it is still reported.
+        assert "vid3: New Episode 3" in result.stdout
+        assert "2 updated, 2 failed" in result.stdout
+        assert "quota exceeded" in result.stdout
+
+    def test_execute_counts_missing_batch_response_as_failure(self, mock_auth):
+        videos = [make_search_video(f"vid{i}", f"OLDNAME Episode {i}") for i in range(2)]
+        setup_search_mock(mock_auth, videos)
+
+        class DroppingBatch(FakeBatch):
+            def execute(self):
+                self._requests.pop()
+                super().execute()
+
+        mock_auth.new_batch_http_request.side_effect = lambda callback=None: DroppingBatch(callback)
+
+        result = runner.invoke(
+            app,
+            ["videos", "search-replace", "-s", "OLDNAME", "-r", "New", "-f", "title", "--execute"],
+        )
+        assert result.exit_code == 0
+        assert "vid1: no response in batch" in result.stdout
+        assert "1 updated, 1 failed" in result.stdout
+
+    def test_execute_reports_partial_progress_on_transport_error(self, mock_auth):
+        videos = [make_search_video(f"vid{i}", f"OLDNAME Episode {i}") for i in range(51)]
+        setup_search_mock(mock_auth, videos)
+        broken = MagicMock()
+        broken.execute.side_effect = TimeoutError("timed out")
+        batches = iter([FakeBatch, lambda callback: broken])
+        mock_auth.new_batch_http_request.side_effect = lambda callback=None: next(batches)(callback)
+
+        args = ["videos", "search-replace", "-s", "OLDNAME", "-r", "New", "-f", "title"]
+        result = runner.invoke(app, [*args, "-n", "51", "--execute"])
+        assert isinstance(result.exception, TimeoutError)
+        assert "Partial progress:" in result.stdout
+        assert "50 updated, 0 failed, 1 unconfirmed" in result.stdout
+
+    def test_invalid_regex_exits_before_any_api_call(self, mock_auth):
+        result = runner.invoke(
+            app,
+            ["videos", "search-replace", "-s", "(", "-r", "x", "-f", "title", "--regex"],
+        )
+        assert result.exit_code == 1
+        assert "Invalid regex" in result.stdout
+        mock_auth.search.return_value.list.assert_not_called()
+
     def test_no_matches(self, mock_auth):
         videos = [make_search_video("vid1", "Some Other Title")]
         setup_search_mock(mock_auth, videos)